@@ -1,5 +1,13 @@
 from __future__ import annotations
 
-from src.agent.factory import create_ken_agent
+from src.agent.cache import AgentCache
+from src.agent.factory import build_ken_agent, create_ken_agent, open_checkpointer
+from src.agent.messages import message_text
 
-__all__ = ["create_ken_agent"]
+__all__ = [
+    "AgentCache",
+    "build_ken_agent",
+    "create_ken_agent",
+    "message_text",
+    "open_checkpointer",
+]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from src.agent.factory import _collect_skill_paths, build_ken_agent
+from src.config.settings import get_settings
+
+if TYPE_CHECKING:
+    from langgraph.checkpoint.base import BaseCheckpointSaver
+    from langgraph.graph import CompiledStateGraph
+
+    from src.config.settings import Settings
+
+
+class AgentCache:
+    """
+    LRU cache of compiled agents sharing a single checkpointer.
+
+    Each user has one cached agent, tagged with the skill paths it was built
+    with, so a request for a known user is a dict lookup instead of a graph
+    rebuild. When the user's skills change, the new build replaces the old.
+    Conversation state lives in the checkpointer, not the compiled graph,
+    which makes the graphs safe to reuse across requests.
+
+    Builds run in a worker thread so they never block the event loop, and
+    concurrent requests for the same key share a single in-flight build.
+
+    Usage:
+        async with open_checkpointer(settings.database_url) as checkpointer:
+            cache = AgentCache(checkpointer)
+            agent = await cache.get_or_create("user-123")
+    """
+
+    def __init__(
+        self,
+        checkpointer: BaseCheckpointSaver[str],
+        settings: Settings | None = None,
+        maxsize: int = 256,
+    ) -> None:
+        self.checkpointer = checkpointer
+        self.settings = settings or get_settings()
+        self.maxsize = maxsize
+        self._agents: OrderedDict[str, tuple[tuple[str, ...], CompiledStateGraph]] = OrderedDict()
+        self._pending: dict[tuple[str, tuple[str, ...]], asyncio.Task[CompiledStateGraph]] = {}
+
+    async def get_or_create(self, user_id: str) -> CompiledStateGraph:
+        """Get the compiled agent for a user, building it on first use."""
+        skill_paths = _collect_skill_paths(self.settings, user_id)
+        skills = tuple(sorted(skill_paths))
+
+        entry = self._agents.get(user_id)
+        if entry is not None and entry[0] == skills:
+            self._agents.move_to_end(user_id)
+            return entry[1]
+
+        key = (user_id, skills)
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self._build(key, user_id, skill_paths))
+            self._pending[key] = task
+        # Shield the shared build so one cancelled caller doesn't abort it for the rest
+        return await asyncio.shield(task)
+
+    async def _build(
+        self, key: tuple[str, tuple[str, ...]], user_id: str, skill_paths: list[str]
+    ) -> CompiledStateGraph:
+        try:
+            agent = await asyncio.to_thread(
+                build_ken_agent,
+                self.checkpointer,
+                self.settings,
+                user_id=user_id,
+                skills=skill_paths,
+            )
+        finally:
+            self._pending.pop(key, None)
+
+        self._agents[user_id] = (key[1], agent)
+        self._agents.move_to_end(user_id)
+        if len(self._agents) > self.maxsize:
+            self._agents.popitem(last=False)
+        return agent
+
+    def clear(self) -> None:
+        """Drop all cached agents."""
+        self._agents.clear()
+
+    def __len__(self) -> int:
+        return len(self._agents)
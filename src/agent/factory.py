@@ -1,22 +1,61 @@
 from __future__ import annotations
 
+import asyncio
+import io
+import logging
+import threading
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
+import httpx
+import orjson
 from deepagents import create_deep_agent
 from deepagents.backends import CompositeBackend, FilesystemBackend, StateBackend
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.tools import tool
-from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 
-from src.config.settings import Settings, get_settings
+from src.agent.messages import message_text
+from src.agent.prompts import (
+    CODING_SUBAGENT_PROMPT,
+    PLANNING_SUBAGENT_PROMPT,
+    RESEARCH_SUBAGENT_PROMPT,
+    get_system_prompt,
+)
+from src.agent.tool_cache import TOOL_CACHE_TTLS, cached_tool
+from src.config.settings import Settings, get_settings, parse_model_string
+from src.http.backpressure import backpressured
+from src.http.clients import get_web_client
 from src.llm import get_llm
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langgraph.checkpoint.base import BaseCheckpointSaver
+    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
     from langgraph.graph import CompiledStateGraph
 
+logger = logging.getLogger(__name__)
+
+SKILL_PATHS_TTL_SECONDS = 60.0
+CRAWL_POLL_INTERVAL_SECONDS = 2.0
+CRAWL_ITEM_CONCURRENCY = 16
+RESULT_SEPARATOR = "\n---\n"
+SKILL_PATHS_CACHE_MAXSIZE = 1024
+CHECKPOINT_POOL_MIN_SIZE = 2
+CHECKPOINT_POOL_MAX_SIZE = 10
+
+_checkpointer_setup_done = False
+_PROVISIONED: set[tuple[str, str]] = set()
+_provision_lock = threading.Lock()
+_skill_paths_cache: dict[tuple[str, str], tuple[float, tuple[str, ...]]] = {}
+_web_config_cache: tuple[Settings, WebToolConfig] | None = None
+
 
 @dataclass
 class AgentContext:
@@ -46,29 +85,222 @@ def _make_user_backend_factory(user_id: str, data_path: Path):
     user_dir = data_path / "users" / user_id
     shared_dir = data_path / "shared"
 
-    user_dir.mkdir(parents=True, exist_ok=True)
-    shared_dir.mkdir(parents=True, exist_ok=True)
+    provision_key = (user_id, str(data_path))
+    if provision_key not in _PROVISIONED:
+        with _provision_lock:
+            user_dir.mkdir(parents=True, exist_ok=True)
+            shared_dir.mkdir(parents=True, exist_ok=True)
+            _PROVISIONED.add(provision_key)
+
+    user_fs = FilesystemBackend(root_dir=str(user_dir), virtual_mode=True)
+    shared_fs = FilesystemBackend(root_dir=str(shared_dir), virtual_mode=True)
 
     def make_backend(runtime) -> CompositeBackend:
         return CompositeBackend(
             default=StateBackend(runtime),
-            routes={
-                "/user/": FilesystemBackend(
-                    root_dir=str(user_dir),
-                    virtual_mode=True,
-                ),
-                "/shared/": FilesystemBackend(
-                    root_dir=str(shared_dir),
-                    virtual_mode=True,
-                ),
-            },
+            routes={"/user/": user_fs, "/shared/": shared_fs},
         )
 
     return make_backend
 
 
+@dataclass(frozen=True, slots=True)
+class WebToolConfig:
+    """Web tool credentials and endpoints, resolved once per settings instance."""
+
+    tavily_api_key: str | None
+    tavily_base_url: str
+    firecrawl_api_key: str | None
+    firecrawl_base_url: str
+    crawl_summarization_model: str | None
+
+
+def _web_config() -> WebToolConfig:
+    """Get the web tool config, rebuilding it only when settings are replaced."""
+    global _web_config_cache
+
+    settings = get_settings()
+    if _web_config_cache is None or _web_config_cache[0] is not settings:
+        _web_config_cache = (
+            settings,
+            WebToolConfig(
+                tavily_api_key=settings.tavily_api_key,
+                tavily_base_url=settings.tavily_base_url,
+                firecrawl_api_key=settings.firecrawl_api_key,
+                firecrawl_base_url=settings.firecrawl_base_url,
+                crawl_summarization_model=(
+                    settings.llm.summarization_model if settings.web_crawl_summarize else None
+                ),
+            ),
+        )
+    return _web_config_cache[1]
+
+
+def _crawl_summarizer(config: WebToolConfig) -> BaseChatModel | None:
+    """Get the summarization model for crawled pages, if enabled."""
+    if config.crawl_summarization_model is None:
+        return None
+    return _get_cached_model(*parse_model_string(config.crawl_summarization_model))
+
+
+@backpressured("firecrawl")
+async def _firecrawl_post(
+    operation: str,
+    payload: dict[str, Any],
+    api_key: str,
+    base_url: str,
+) -> dict[str, Any]:
+    """POST to a Firecrawl endpoint on the shared pooled client."""
+    settings = get_settings()
+    client = get_web_client()
+
+    response = await client.post(
+        f"{base_url}/{operation}",
+        json=payload,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        timeout=settings.http_timeouts.get(operation, 60.0),
+    )
+    response.raise_for_status()
+    return cast("dict[str, Any]", orjson.loads(response.content))
+
+
+@backpressured("firecrawl")
+async def _firecrawl_get(path: str, api_key: str, base_url: str) -> dict[str, Any]:
+    """GET a Firecrawl endpoint on the shared pooled client."""
+    settings = get_settings()
+    client = get_web_client()
+
+    response = await client.get(
+        f"{base_url}/{path}",
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=settings.http_timeouts.get("crawl_status", 60.0),
+    )
+    response.raise_for_status()
+    return cast("dict[str, Any]", orjson.loads(response.content))
+
+
+class CrawlIncompleteError(Exception):
+    """Raised when a crawl job does not finish before its deadline."""
+
+    def __init__(self, job_id: str, pages: list[dict[str, Any]]) -> None:
+        super().__init__(f"Crawl job {job_id} did not complete in time")
+        self.pages = pages
+
+
+async def _firecrawl_crawl(
+    payload: dict[str, Any],
+    api_key: str,
+    base_url: str,
+) -> list[dict[str, Any]]:
+    """Start a Firecrawl crawl job and poll it until it completes.
+
+    Args:
+        payload: Crawl request body
+        api_key: Firecrawl API key
+        base_url: Firecrawl API base URL
+
+    Returns:
+        Crawled page records
+
+    Raises:
+        CrawlIncompleteError: If the job is still running at the deadline;
+            carries the pages received so far
+        RuntimeError: If Firecrawl reports the job as failed
+    """
+    settings = get_settings()
+    job = await _firecrawl_post("crawl", payload, api_key, base_url)
+
+    job_id = job.get("id")
+    if not job_id:
+        return cast("list[dict[str, Any]]", job.get("data", []))
+
+    deadline = time.monotonic() + settings.http_timeouts.get("crawl", 120.0)
+    while True:
+        status = await _firecrawl_get(f"crawl/{job_id}", api_key, base_url)
+        state = status.get("status")
+
+        if state == "completed":
+            return cast("list[dict[str, Any]]", status.get("data", []))
+        if state in ("failed", "cancelled"):
+            raise RuntimeError(f"crawl job {job_id} {state}")
+        if time.monotonic() >= deadline:
+            raise CrawlIncompleteError(job_id, status.get("data", []))
+
+        await asyncio.sleep(CRAWL_POLL_INTERVAL_SECONDS)
+
+
+async def _format_crawl_item(
+    item: dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    summarizer: BaseChatModel | None = None,
+) -> str:
+    """Format one crawled page, summarizing it first when a summarizer is given.
+
+    A failed summary falls back to the truncated markdown so one page can't
+    sink the whole crawl result.
+    """
+    source_url = item.get("metadata", {}).get("sourceURL", item.get("url", "Unknown"))
+    markdown = item.get("markdown", "")
+
+    if summarizer is None or not markdown:
+        return f"**{source_url}**\n{markdown[:500]}...\n"
+
+    try:
+        async with semaphore:
+            response = await summarizer.ainvoke(
+                [
+                    SystemMessage(
+                        content="Summarize the following web page in no more than 500 characters. "
+                        "Be concise and capture the key points."
+                    ),
+                    HumanMessage(content=markdown),
+                ]
+            )
+    except Exception:
+        logger.warning("Summarizing %s failed; using truncated page", source_url, exc_info=True)
+        return f"**{source_url}**\n{markdown[:500]}...\n"
+    return f"**{source_url}**\n{message_text(response)}\n"
+
+
+async def _format_crawl_pages(
+    pages: list[dict[str, Any]],
+    max_pages: int,
+    summarizer: BaseChatModel | None = None,
+) -> str:
+    """Format crawled pages concurrently, bounded by CRAWL_ITEM_CONCURRENCY."""
+    semaphore = asyncio.Semaphore(CRAWL_ITEM_CONCURRENCY)
+    formatted = await asyncio.gather(
+        *(_format_crawl_item(item, semaphore, summarizer) for item in pages[:max_pages])
+    )
+
+    buf = io.StringIO()
+    for block in formatted:
+        if buf.tell():
+            buf.write(RESULT_SEPARATOR)
+        buf.write(block)
+
+    return buf.getvalue() or "No pages crawled."
+
+
+def _format_search_results(results: Iterable[tuple[str, str, str]]) -> str:
+    """Render (title, url, content) records as markdown blocks in a single buffer."""
+    buf = io.StringIO()
+    for title, url, content in results:
+        if buf.tell():
+            buf.write(RESULT_SEPARATOR)
+        buf.write("**")
+        buf.write(title)
+        buf.write("**\n")
+        buf.write(url)
+        buf.write("\n")
+        buf.write(content)
+        buf.write("\n")
+
+    return buf.getvalue()
+
+
 @tool
-def web_search(query: str) -> str:
+async def web_search(query: str) -> str:
     """Search the web for up-to-date information.
 
     Uses Tavily if configured, otherwise falls back to Firecrawl.
@@ -79,60 +311,88 @@ def web_search(query: str) -> str:
     Returns:
         Search results as a formatted string
     """
-    settings = get_settings()
+    config = _web_config()
 
-    if settings.tavily_api_key:
-        return _web_search_tavily(query, settings.tavily_api_key)
-    elif settings.firecrawl_api_key:
-        return _web_search_firecrawl(query, settings.firecrawl_api_key, settings.firecrawl_base_url)
+    if config.tavily_api_key:
+        return await _web_search_tavily(query, config.tavily_api_key, config.tavily_base_url)
+    elif config.firecrawl_api_key:
+        return await _web_search_firecrawl(
+            query, config.firecrawl_api_key, config.firecrawl_base_url
+        )
     else:
         return "Error: No search API configured. Set either TAVILY_API_KEY or FIRECRAWL_API_KEY in your .env file."
 
 
-def _web_search_tavily(query: str, api_key: str) -> str:
+async def _web_search_tavily(query: str, api_key: str, base_url: str) -> str:
     """Search using Tavily API."""
-    from tavily import TavilyClient
+    payload = {"query": query, "max_results": 5}
 
-    client = TavilyClient(api_key=api_key)
-    results = client.search(query, max_results=5)
+    try:
+        results = await cached_tool(
+            "web_search:tavily",
+            payload,
+            ttl=TOOL_CACHE_TTLS["web_search"],
+            fn=lambda: _tavily_post("search", payload, api_key, base_url),
+        )
 
-    if not results.get("results"):
-        return "No results found."
+        if not results.get("results"):
+            return "No results found."
 
-    output = []
-    for r in results["results"]:
-        output.append(
-            f"**{r.get('title', 'Untitled')}**\n{r.get('url', '')}\n{r.get('content', '')}\n"
+        return _format_search_results(
+            (r.get("title", "Untitled"), r.get("url", ""), r.get("content", ""))
+            for r in results["results"]
         )
+    except httpx.HTTPStatusError as e:
+        return f"Error searching: {e.response.status_code} - {e.response.text}"
+    except Exception as e:
+        return f"Error searching: {e}"
+
 
-    return "\n---\n".join(output)
+@backpressured("tavily")
+async def _tavily_post(
+    operation: str,
+    payload: dict[str, Any],
+    api_key: str,
+    base_url: str,
+) -> dict[str, Any]:
+    """POST to a Tavily endpoint on the shared pooled client."""
+    settings = get_settings()
+    client = get_web_client()
 
+    response = await client.post(
+        f"{base_url}/{operation}",
+        json=payload,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        timeout=settings.http_timeouts.get(operation, 60.0),
+    )
+    response.raise_for_status()
+    return cast("dict[str, Any]", orjson.loads(response.content))
 
-def _web_search_firecrawl(query: str, api_key: str, base_url: str) -> str:
-    """Search using Firecrawl API."""
-    import httpx
 
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+async def _web_search_firecrawl(query: str, api_key: str, base_url: str) -> str:
+    """Search using Firecrawl API."""
     payload = {"query": query, "limit": 5}
 
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(f"{base_url}/search", json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        data = await cached_tool(
+            "web_search:firecrawl",
+            payload,
+            ttl=TOOL_CACHE_TTLS["web_search"],
+            fn=lambda: _firecrawl_post("search", payload, api_key, base_url),
+        )
 
         results = data.get("data", data.get("results", []))
         if not results:
             return "No results found."
 
-        output = []
-        for r in results[:5]:
-            title = r.get("title", r.get("metadata", {}).get("title", "Untitled"))
-            url = r.get("url", r.get("metadata", {}).get("sourceURL", ""))
-            content = r.get("description", r.get("markdown", ""))[:300]
-            output.append(f"**{title}**\n{url}\n{content}\n")
-
-        return "\n---\n".join(output)
+        return _format_search_results(
+            (
+                r.get("title", r.get("metadata", {}).get("title", "Untitled")),
+                r.get("url", r.get("metadata", {}).get("sourceURL", "")),
+                r.get("description", r.get("markdown", ""))[:300],
+            )
+            for r in results[:5]
+        )
     except httpx.HTTPStatusError as e:
         return f"Error searching: {e.response.status_code} - {e.response.text}"
     except Exception as e:
@@ -140,7 +400,7 @@ def _web_search_firecrawl(query: str, api_key: str, base_url: str) -> str:
 
 
 @tool
-def web_scrape(url: str) -> str:
+async def web_scrape(url: str) -> str:
     """Scrape content from a web page using Firecrawl.
 
     Args:
@@ -149,23 +409,22 @@ def web_scrape(url: str) -> str:
     Returns:
         The page content as markdown
     """
-    import httpx
-
-    settings = get_settings()
-    api_key = settings.firecrawl_api_key
-    base_url = settings.firecrawl_base_url
+    config = _web_config()
+    api_key = config.firecrawl_api_key
+    base_url = config.firecrawl_base_url
 
     if not api_key:
         return "Error: FIRECRAWL_API_KEY not configured. Set it in your .env file."
 
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
     payload = {"url": url, "formats": ["markdown"]}
 
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(f"{base_url}/scrape", json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        data = await cached_tool(
+            "web_scrape",
+            payload,
+            ttl=TOOL_CACHE_TTLS["web_scrape"],
+            fn=lambda: _firecrawl_post("scrape", payload, api_key, base_url),
+        )
 
         if "data" in data and "markdown" in data["data"]:
             return data["data"]["markdown"]
@@ -177,9 +436,12 @@ def web_scrape(url: str) -> str:
 
 
 @tool
-def web_crawl(url: str, max_pages: int = 10) -> str:
+async def web_crawl(url: str, max_pages: int = 10) -> str:
     """Crawl a website starting from a URL using Firecrawl.
 
+    Starts an asynchronous crawl job and polls it until it completes. If the
+    job runs past its deadline, the pages crawled so far are returned.
+
     Args:
         url: The starting URL to crawl
         max_pages: Maximum number of pages to crawl (default: 10)
@@ -187,31 +449,28 @@ def web_crawl(url: str, max_pages: int = 10) -> str:
     Returns:
         List of crawled URLs and their content summaries
     """
-    import httpx
-
-    settings = get_settings()
-    api_key = settings.firecrawl_api_key
-    base_url = settings.firecrawl_base_url
+    config = _web_config()
+    api_key = config.firecrawl_api_key
+    base_url = config.firecrawl_base_url
 
     if not api_key:
         return "Error: FIRECRAWL_API_KEY not configured. Set it in your .env file."
 
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
     payload = {"url": url, "limit": max_pages, "scrapeOptions": {"formats": ["markdown"]}}
 
     try:
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(f"{base_url}/crawl", json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-
-        results = []
-        for item in data.get("data", [])[:max_pages]:
-            source_url = item.get("metadata", {}).get("sourceURL", item.get("url", "Unknown"))
-            md_content = item.get("markdown", "")[:500]
-            results.append(f"**{source_url}**\n{md_content}...\n")
-
-        return "\n---\n".join(results) if results else "No pages crawled."
+        pages = await cached_tool(
+            "web_crawl",
+            payload,
+            ttl=TOOL_CACHE_TTLS["web_crawl"],
+            fn=lambda: _firecrawl_crawl(payload, api_key, base_url),
+        )
+        return await _format_crawl_pages(pages, max_pages, _crawl_summarizer(config))
+    except CrawlIncompleteError as e:
+        if not e.pages:
+            return f"Error crawling {url}: {e}"
+        formatted = await _format_crawl_pages(e.pages, max_pages, _crawl_summarizer(config))
+        return f"(partial results, crawl still running)\n\n{formatted}"
     except httpx.HTTPStatusError as e:
         return f"Error crawling {url}: {e.response.status_code} - {e.response.text}"
     except Exception as e:
@@ -219,7 +478,7 @@ def web_crawl(url: str, max_pages: int = 10) -> str:
 
 
 @tool
-def web_map(url: str, search_query: str | None = None) -> str:
+async def web_map(url: str, search_query: str | None = None) -> str:
     """Map a website to discover all URLs. Optionally filter by search query.
 
     Args:
@@ -229,25 +488,24 @@ def web_map(url: str, search_query: str | None = None) -> str:
     Returns:
         List of discovered URLs
     """
-    import httpx
-
-    settings = get_settings()
-    api_key = settings.firecrawl_api_key
-    base_url = settings.firecrawl_base_url
+    config = _web_config()
+    api_key = config.firecrawl_api_key
+    base_url = config.firecrawl_base_url
 
     if not api_key:
         return "Error: FIRECRAWL_API_KEY not configured. Set it in your .env file."
 
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
     payload = {"url": url}
     if search_query:
         payload["search"] = search_query
 
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(f"{base_url}/map", json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        data = await cached_tool(
+            "web_map",
+            payload,
+            ttl=TOOL_CACHE_TTLS["web_map"],
+            fn=lambda: _firecrawl_post("map", payload, api_key, base_url),
+        )
 
         links = data.get("links", [])
         if not links:
@@ -260,9 +518,9 @@ def web_map(url: str, search_query: str | None = None) -> str:
         return f"Error mapping {url}: {e}"
 
 
-def _get_model(settings: Settings):
-    """Get the LLM model from settings."""
-    provider, model = settings.llm.get_default_provider_model()
+@lru_cache(maxsize=32)
+def _get_cached_model(provider: str, model: str) -> BaseChatModel:
+    """Create a chat model once per (provider, model) pair."""
     return get_llm(provider=provider, model=model)
 
 
@@ -272,7 +530,17 @@ def _collect_skill_paths(settings: Settings, user_id: str) -> list[str]:
     Priority:
     1. Team skills - /data/shared/skills/
     2. User skills - /data/users/{user_id}/skills/
+
+    Results are cached for SKILL_PATHS_TTL_SECONDS so the skill
+    directories are not stat'ed on every request.
     """
+    key = (str(settings.data_path), user_id)
+    now = time.monotonic()
+
+    cached = _skill_paths_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return list(cached[1])
+
     skill_paths = []
 
     team_skills = settings.shared_path / "skills"
@@ -283,93 +551,145 @@ def _collect_skill_paths(settings: Settings, user_id: str) -> list[str]:
     if user_skills.exists():
         skill_paths.append(str(user_skills))
 
+    if len(_skill_paths_cache) >= SKILL_PATHS_CACHE_MAXSIZE:
+        _skill_paths_cache.clear()
+    _skill_paths_cache[key] = (now + SKILL_PATHS_TTL_SECONDS, tuple(skill_paths))
+
     return skill_paths
 
 
-SUBAGENTS = [
+TOOLS = (web_search, web_scrape, web_crawl, web_map)
+
+SUBAGENTS: tuple[dict[str, str], ...] = (
     {
         "name": "coder",
         "description": "Write, debug, and refactor code. Use for programming tasks.",
-        "system_prompt": "You are a specialized coding assistant. Write clean, well-documented code.",
+        "system_prompt": CODING_SUBAGENT_PROMPT,
     },
     {
         "name": "researcher",
         "description": "Search the web and gather information. Use for research tasks.",
-        "system_prompt": "You are a specialized research assistant. Gather and synthesize information from web search and scraping tools.",
+        "system_prompt": RESEARCH_SUBAGENT_PROMPT,
     },
     {
         "name": "planner",
         "description": "Break down complex tasks into actionable steps. Use for planning.",
-        "system_prompt": "You are a specialized planning assistant. Analyze and organize complex tasks into manageable steps.",
+        "system_prompt": PLANNING_SUBAGENT_PROMPT,
     },
-]
+)
 
 
-def _build_system_prompt(agent_name: str) -> str:
-    """Build the system prompt with the agent's name."""
-    return f"""You are {agent_name}, a deep agent with executive assistant capabilities.
+@lru_cache(maxsize=8)
+def _base_agent_kwargs(agent_name: str, provider: str, model: str) -> dict[str, Any]:
+    """Build the user-independent create_deep_agent arguments once per configuration.
 
-## Filesystem Structure
-- `/user/` - Your private data directory (organize as needed: memories, projects, notes)
-- `/shared/` - Team-shared resources (skills, knowledge base, templates)
-- `/workspace/` - Ephemeral workspace (cleared between threads)
+    Callers must copy the returned dict (e.g. ``{**base, ...}``) rather than
+    mutate it, since it is shared across agents.
+    """
+    return {
+        "model": _get_cached_model(provider, model),
+        "system_prompt": get_system_prompt(agent_name),
+        "tools": list(TOOLS),
+        "subagents": list(SUBAGENTS),
+    }
 
-## Capabilities
-- **Planning**: Break down complex tasks using the todo list
-- **File Operations**: Read, write, edit files in /user/ and /shared/
-- **Web Search**: Use web_search to find current information
-- **Web Scraping**: Use web_scrape, web_crawl, web_map for web data
-- **Subagents**: Delegate specialized work to coder, researcher, or planner
 
-## Guidelines
-1. Organize user data in /user/ (e.g., /user/memories/, /user/projects/)
-2. Check /shared/ for team resources and skills
-3. Save important information for future sessions
-4. Ask for clarification when uncertain about user needs
-"""
+@asynccontextmanager
+async def open_checkpointer(database_url: str) -> AsyncIterator[AsyncPostgresSaver]:
+    """Open a Postgres checkpointer, running the schema setup once per process.
 
+    The saver is backed by a connection pool, so concurrent agent runs
+    read and write checkpoints in parallel instead of queueing on one
+    connection.
 
-@asynccontextmanager
-async def create_ken_agent(
+    Args:
+        database_url: PostgreSQL connection URL
+
+    Yields:
+        Connected AsyncPostgresSaver
+    """
+    global _checkpointer_setup_done
+
+    # Imported here so code that only builds agents (tests, in-memory savers)
+    # does not load psycopg and libpq.
+    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+    from psycopg import AsyncConnection
+    from psycopg.rows import DictRow, dict_row
+    from psycopg_pool import AsyncConnectionPool
+
+    async with AsyncConnectionPool(
+        database_url,
+        connection_class=AsyncConnection[DictRow],
+        min_size=CHECKPOINT_POOL_MIN_SIZE,
+        max_size=CHECKPOINT_POOL_MAX_SIZE,
+        kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        open=False,
+    ) as pool:
+        checkpointer = AsyncPostgresSaver(pool)
+        if not _checkpointer_setup_done:
+            await checkpointer.setup()
+            _checkpointer_setup_done = True
+
+        yield checkpointer
+
+
+def build_ken_agent(
+    checkpointer: BaseCheckpointSaver[str],
     settings: Settings | None = None,
     user_id: str = "default",
     skills: list[str] | None = None,
-) -> AsyncIterator[CompiledStateGraph]:
-    """Create an Executive Assistant deep agent with Postgres checkpoints and user-isolated memory.
+) -> CompiledStateGraph:
+    """Build an Executive Assistant deep agent on an already-open checkpointer.
 
     Args:
+        checkpointer: Checkpointer shared across agents (e.g. from open_checkpointer)
         settings: Application settings (defaults to global settings)
         user_id: User identifier for memory isolation
         skills: Override skill paths (if None, uses three-tier skill system)
 
-    Yields:
+    Returns:
         Compiled LangGraph agent ready for invocation
     """
     if settings is None:
         settings = get_settings()
 
-    model = _get_model(settings)
-    db_uri = settings.database_url
-    agent_name = settings.agent_name
+    skill_paths = skills if skills is not None else _collect_skill_paths(settings, user_id)
+
+    provider, model = settings.llm.get_default_provider_model()
+    agent_kwargs: dict[str, Any] = {
+        **_base_agent_kwargs(settings.agent_name, provider, model),
+        "name": f"ea-{user_id}",
+        "checkpointer": checkpointer,
+        "backend": _make_user_backend_factory(user_id, settings.data_path),
+    }
+
+    if skill_paths:
+        agent_kwargs["skills"] = skill_paths
 
-    async with AsyncPostgresSaver.from_conn_string(db_uri) as checkpointer:
-        await checkpointer.setup()
+    return create_deep_agent(**agent_kwargs)
 
-        skill_paths = skills if skills is not None else _collect_skill_paths(settings, user_id)
 
-        agent_kwargs: dict[str, Any] = {
-            "name": f"ea-{user_id}",
-            "model": model,
-            "system_prompt": _build_system_prompt(agent_name),
-            "checkpointer": checkpointer,
-            "backend": _make_user_backend_factory(user_id, settings.data_path),
-            "tools": [web_search, web_scrape, web_crawl, web_map],
-            "subagents": SUBAGENTS,
-        }
+@asynccontextmanager
+async def create_ken_agent(
+    settings: Settings | None = None,
+    user_id: str = "default",
+    skills: list[str] | None = None,
+) -> AsyncIterator[CompiledStateGraph]:
+    """Create an Executive Assistant deep agent with Postgres checkpoints and user-isolated memory.
+
+    Opens a dedicated checkpointer for the lifetime of the context. Long-running
+    services should open one checkpointer and use AgentCache instead.
 
-        if skill_paths:
-            agent_kwargs["skills"] = skill_paths
+    Args:
+        settings: Application settings (defaults to global settings)
+        user_id: User identifier for memory isolation
+        skills: Override skill paths (if None, uses three-tier skill system)
 
-        agent = create_deep_agent(**agent_kwargs)
+    Yields:
+        Compiled LangGraph agent ready for invocation
+    """
+    if settings is None:
+        settings = get_settings()
 
-        yield agent
+    async with open_checkpointer(settings.database_url) as checkpointer:
+        yield build_ken_agent(checkpointer, settings, user_id=user_id, skills=skills)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+
+
+def message_text(message: BaseMessage) -> str:
+    """Get the text of a message.
+
+    Content is either a plain string or a list of content blocks (e.g. from
+    Anthropic models); for the latter, only the text blocks are joined.
+
+    Args:
+        message: Any LangChain message
+
+    Returns:
+        The message text
+    """
+    content = message.content
+    if isinstance(content, str):
+        return content
+
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+TOOL_CACHE_TTLS: dict[str, float] = {
+    "web_search": 600.0,
+    "web_scrape": 3600.0,
+    "web_crawl": 3600.0,
+    "web_map": 86400.0,
+}
+TOOL_CACHE_MAXSIZE = 1024
+
+_tool_cache: dict[str, tuple[float, Any]] = {}
+
+
+def tool_cache_key(name: str, args: dict[str, Any]) -> str:
+    """Build a stable cache key from a tool name and its arguments."""
+    raw = name + json.dumps(args, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+async def cached_tool(
+    name: str,
+    args: dict[str, Any],
+    ttl: float,
+    fn: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Return a cached tool result, calling fn on a miss.
+
+    Only successful results are cached; exceptions from fn propagate and
+    leave the cache untouched so failures are retried on the next call.
+
+    Args:
+        name: Tool (or tool:provider) name
+        args: Normalized tool arguments
+        ttl: Time to live in seconds
+        fn: Zero-argument coroutine factory producing the result
+
+    Returns:
+        The cached or freshly fetched result
+    """
+    key = tool_cache_key(name, args)
+    now = time.monotonic()
+
+    cached = _tool_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    result = await fn()
+
+    if len(_tool_cache) >= TOOL_CACHE_MAXSIZE:
+        _evict(now)
+    _tool_cache[key] = (now + ttl, result)
+    return result
+
+
+def _evict(now: float) -> None:
+    expired = [key for key, (expires_at, _) in _tool_cache.items() if expires_at <= now]
+    for key in expired:
+        del _tool_cache[key]
+    if len(_tool_cache) >= TOOL_CACHE_MAXSIZE:
+        del _tool_cache[next(iter(_tool_cache))]
+
+
+def clear_tool_cache() -> None:
+    """Drop all cached tool results (useful for testing)."""
+    _tool_cache.clear()
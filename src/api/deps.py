@@ -0,0 +1,9 @@
+from fastapi import Request
+
+from src.agent import AgentCache
+
+
+def get_agent_cache(request: Request) -> AgentCache:
+    """Get the shared agent cache created in the application lifespan."""
+    agent_cache: AgentCache = request.app.state.agent_cache
+    return agent_cache
@@ -7,7 +7,14 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from src.agent import AgentCache, open_checkpointer
 from src.config.settings import get_settings
+from src.http.clients import (
+    close_oauth_client,
+    close_web_client,
+    get_oauth_client,
+    get_web_client,
+)
 from src.llm.errors import LLMError
 from src.storage.postgres import get_postgres_connection
 
@@ -23,8 +30,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     postgres = get_postgres_connection(settings.database_url)
     await postgres.connect()
 
-    yield
+    app.state.web_client = get_web_client()
+    app.state.oauth_client = get_oauth_client()
 
+    async with open_checkpointer(settings.database_url) as checkpointer:
+        app.state.checkpointer = checkpointer
+        app.state.agent_cache = AgentCache(checkpointer, settings)
+
+        yield
+
+    await close_web_client()
+    await close_oauth_client()
     await postgres.disconnect()
 
 
@@ -1,18 +1,44 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessageChunk, HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+from src.agent import AgentCache, message_text
+from src.api.deps import get_agent_cache
+from src.llm import get_summarization_llm
+
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from langchain_core.messages import BaseMessage
+
 router = APIRouter()
 
+DONE_FRAME = b"data: [DONE]\n\n"
+REPLY_NODE = "model"
+
+
+def _reply_text(msg_chunk: BaseMessage, metadata: dict[str, Any]) -> str:
+    """Get the reply text carried by a streamed chunk, or "" if it isn't reply text.
+
+    stream_mode="messages" surfaces every chat-model call in the graph, so
+    conversation summaries and tool-internal calls (e.g. crawl summaries)
+    are filtered out along with tool-call deltas.
+    """
+    if not isinstance(msg_chunk, AIMessageChunk):
+        return ""
+    if metadata.get("langgraph_node") != REPLY_NODE:
+        return ""
+    if metadata.get("lc_source") == "summarization":
+        return ""
+    return message_text(msg_chunk)
+
 
 class MessageRequest(BaseModel):
     message: str = Field(..., description="User message to the agent")
@@ -27,7 +53,10 @@ class MessageResponse(BaseModel):
 
 
 @router.post("/message", response_model=MessageResponse)
-async def send_message(request: MessageRequest) -> MessageResponse:
+async def send_message(
+    request: MessageRequest,
+    agent_cache: AgentCache = Depends(get_agent_cache),
+) -> MessageResponse:
     """Send a message to Ken and get a response.
 
     Ken is a deep agent with:
@@ -37,55 +66,46 @@ async def send_message(request: MessageRequest) -> MessageResponse:
     - Todo list for planning
     - Persistent memory via Postgres checkpoints
     """
-    from src.agent import create_ken_agent
-    from src.config.settings import get_settings
-
-    settings = get_settings()
     thread_id = request.thread_id or f"{request.user_id}-default"
 
-    async with create_ken_agent(settings, user_id=request.user_id) as agent:
-        result = await agent.ainvoke(
-            {"messages": [HumanMessage(content=request.message)]},
-            config={"configurable": {"thread_id": thread_id}},
-        )
-
-    last_message = result["messages"][-1]
-    content = last_message.content if hasattr(last_message, "content") else str(last_message)
+    agent = await agent_cache.get_or_create(request.user_id)
+    result = await agent.ainvoke(
+        {"messages": [HumanMessage(content=request.message)]},
+        config={"configurable": {"thread_id": thread_id}},
+    )
 
     return MessageResponse(
-        content=content,
+        content=message_text(result["messages"][-1]),
         thread_id=thread_id,
     )
 
 
 @router.post("/message/stream")
-async def send_message_stream(request: MessageRequest) -> StreamingResponse:
+async def send_message_stream(
+    request: MessageRequest,
+    agent_cache: AgentCache = Depends(get_agent_cache),
+) -> StreamingResponse:
     """Send a message to Ken and stream the response.
 
     Returns Server-Sent Events with:
-    - Content chunks as they're generated
+    - {"chunk": ...} JSON payloads with content deltas as they're generated
     - [THREAD:id] marker for thread ID
     - [DONE] marker when complete
     """
-    from src.agent import create_ken_agent
-    from src.config.settings import get_settings
-
-    settings = get_settings()
     thread_id = request.thread_id or f"{request.user_id}-default"
+    agent = await agent_cache.get_or_create(request.user_id)
 
-    async def generate() -> AsyncGenerator[str]:
-        async with create_ken_agent(settings, user_id=request.user_id) as agent:
-            async for chunk in agent.astream(
-                {"messages": [HumanMessage(content=request.message)]},
-                config={"configurable": {"thread_id": thread_id}},
-                stream_mode="values",
-            ):
-                if "messages" in chunk and chunk["messages"]:
-                    last_msg = chunk["messages"][-1]
-                    if hasattr(last_msg, "content") and last_msg.content:
-                        yield f"data: {last_msg.content}\n\n"
-        yield f"data: [THREAD:{thread_id}]\n\n"
-        yield "data: [DONE]\n\n"
+    async def generate() -> AsyncGenerator[bytes]:
+        async for msg_chunk, metadata in agent.astream(
+            {"messages": [HumanMessage(content=request.message)]},
+            config={"configurable": {"thread_id": thread_id}},
+            stream_mode="messages",
+        ):
+            text = _reply_text(msg_chunk, metadata)
+            if text:
+                yield b"data: " + orjson.dumps({"chunk": text}) + b"\n\n"
+        yield b"data: [THREAD:" + thread_id.encode() + b"]\n\n"
+        yield DONE_FRAME
 
     return StreamingResponse(
         generate(),
@@ -112,12 +132,6 @@ async def summarize(request: SummarizeRequest) -> SummarizeResponse:
 
     This is a utility endpoint that bypasses the agent for fast summarization.
     """
-    from langchain_core.messages import HumanMessage, SystemMessage
-
-    from src.config.settings import get_settings
-    from src.llm import get_summarization_llm
-
-    settings = get_settings()
     llm = get_summarization_llm()
 
     messages = [
@@ -1,38 +1,57 @@
+import time
 from typing import Any
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from src.config.settings import get_settings
 from src.storage.postgres import get_postgres_connection
 
 router = APIRouter()
 
+HEALTHY = orjson.dumps({"status": "healthy"})
+ALIVE = orjson.dumps({"status": "alive"})
+READY_CACHE_TTL_SECONDS = 1.0
+
+_ready_cache: tuple[float, dict[str, Any]] | None = None
+
 
 @router.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Basic health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=HEALTHY, media_type="application/json")
 
 
 @router.get("/health/ready")
 async def readiness_check() -> dict[str, Any]:
-    """Readiness check including database connectivity."""
+    """Readiness check including database connectivity.
+
+    The result is cached for READY_CACHE_TTL_SECONDS so bursts of probes
+    do not each hit the database.
+    """
+    global _ready_cache
+
+    now = time.monotonic()
+    if _ready_cache is not None and _ready_cache[0] > now:
+        return _ready_cache[1]
 
     settings = get_settings()
     postgres = get_postgres_connection()
 
     db_healthy = await postgres.health_check()
 
-    return {
+    result = {
         "status": "ready" if db_healthy else "not_ready",
         "checks": {
             "database": "healthy" if db_healthy else "unhealthy",
             "langfuse": "enabled" if settings.is_langfuse_configured else "disabled",
         },
     }
+    _ready_cache = (now + READY_CACHE_TTL_SECONDS, result)
+    return result
 
 
 @router.get("/health/live")
-async def liveness_check() -> dict[str, str]:
+async def liveness_check() -> Response:
     """Kubernetes liveness probe endpoint."""
-    return {"status": "alive"}
+    return Response(content=ALIVE, media_type="application/json")
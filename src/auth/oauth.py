@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+from src.http.clients import get_oauth_client
+
+if TYPE_CHECKING:
+    import httpx
 
 
 @dataclass
@@ -14,47 +20,53 @@ class OAuthConfig:
     scope: list[str]
 
 
+def _build_auth_url_prefix(auth_url: str, config: OAuthConfig) -> str:
+    """Encode the request-invariant part of an authorization URL once."""
+    params = {
+        "client_id": config.client_id,
+        "redirect_uri": config.redirect_uri,
+        "response_type": "code",
+        "scope": " ".join(config.scope),
+    }
+    return f"{auth_url}?{urlencode(params)}"
+
+
+def _append_state(auth_url_prefix: str, state: str | None) -> str:
+    if not state:
+        return auth_url_prefix
+    return f"{auth_url_prefix}&{urlencode({'state': state})}"
+
+
 class GoogleOAuth:
     """Google OAuth handler."""
 
     AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
     TOKEN_URL = "https://oauth2.googleapis.com/token"
 
-    def __init__(self, config: OAuthConfig) -> None:
+    def __init__(self, config: OAuthConfig, client: httpx.AsyncClient | None = None) -> None:
         self.config = config
+        self._client = client
+        self._auth_url_prefix = _build_auth_url_prefix(self.AUTH_URL, config)
 
     def get_auth_url(self, state: str | None = None) -> str:
         """Generate the authorization URL."""
-        params = {
-            "client_id": self.config.client_id,
-            "redirect_uri": self.config.redirect_uri,
-            "response_type": "code",
-            "scope": " ".join(self.config.scope),
-        }
-        if state:
-            params["state"] = state
-
-        from urllib.parse import urlencode
-
-        return f"{self.AUTH_URL}?{urlencode(params)}"
+        return _append_state(self._auth_url_prefix, state)
 
     async def exchange_code(self, code: str) -> dict[str, Any]:
         """Exchange authorization code for tokens."""
-        import httpx
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "client_id": self.config.client_id,
-                    "client_secret": self.config.client_secret,
-                    "code": code,
-                    "redirect_uri": self.config.redirect_uri,
-                    "grant_type": "authorization_code",
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._client or get_oauth_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            data={
+                "client_id": self.config.client_id,
+                "client_secret": self.config.client_secret,
+                "code": code,
+                "redirect_uri": self.config.redirect_uri,
+                "grant_type": "authorization_code",
+            },
+        )
+        response.raise_for_status()
+        return response.json()
 
 
 class MicrosoftOAuth:
@@ -63,42 +75,36 @@ class MicrosoftOAuth:
     AUTH_URL = "https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/authorize"
     TOKEN_URL = "https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
 
-    def __init__(self, config: OAuthConfig, tenant_id: str = "common") -> None:
+    def __init__(
+        self,
+        config: OAuthConfig,
+        tenant_id: str = "common",
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.config = config
         self.tenant_id = tenant_id
+        self._client = client
+        self._token_url = self.TOKEN_URL.format(tenant_id=tenant_id)
+        self._auth_url_prefix = _build_auth_url_prefix(
+            self.AUTH_URL.format(tenant_id=tenant_id), config
+        )
 
     def get_auth_url(self, state: str | None = None) -> str:
         """Generate the authorization URL."""
-        auth_url = self.AUTH_URL.format(tenant_id=self.tenant_id)
-        params = {
-            "client_id": self.config.client_id,
-            "redirect_uri": self.config.redirect_uri,
-            "response_type": "code",
-            "scope": " ".join(self.config.scope),
-        }
-        if state:
-            params["state"] = state
-
-        from urllib.parse import urlencode
-
-        return f"{auth_url}?{urlencode(params)}"
+        return _append_state(self._auth_url_prefix, state)
 
     async def exchange_code(self, code: str) -> dict[str, Any]:
         """Exchange authorization code for tokens."""
-        import httpx
-
-        token_url = self.TOKEN_URL.format(tenant_id=self.tenant_id)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                token_url,
-                data={
-                    "client_id": self.config.client_id,
-                    "client_secret": self.config.client_secret,
-                    "code": code,
-                    "redirect_uri": self.config.redirect_uri,
-                    "grant_type": "authorization_code",
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._client or get_oauth_client()
+        response = await client.post(
+            self._token_url,
+            data={
+                "client_id": self.config.client_id,
+                "client_secret": self.config.client_secret,
+                "code": code,
+                "redirect_uri": self.config.redirect_uri,
+                "grant_type": "authorization_code",
+            },
+        )
+        response.raise_for_status()
+        return response.json()
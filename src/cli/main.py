@@ -36,7 +36,7 @@ def message(
 
     from langchain_core.messages import HumanMessage
 
-    from src.agent import create_ken_agent
+    from src.agent import create_ken_agent, message_text
 
     settings = get_settings()
     thread_id = thread or f"{user_id}-cli"
@@ -48,9 +48,7 @@ def message(
                 config={"configurable": {"thread_id": thread_id}},
             )
 
-        last_message = result["messages"][-1]
-        content = last_message.content if hasattr(last_message, "content") else str(last_message)
-        typer.echo(content)
+        typer.echo(message_text(result["messages"][-1]))
 
     asyncio.run(run())
 
@@ -65,7 +63,7 @@ def interactive(
 
     from langchain_core.messages import HumanMessage
 
-    from src.agent import create_ken_agent
+    from src.agent import create_ken_agent, message_text
 
     settings = get_settings()
     agent_name = settings.agent_name
@@ -101,10 +99,7 @@ def interactive(
                     config={"configurable": {"thread_id": current_thread}},
                 )
 
-                last_message = result["messages"][-1]
-                content = (
-                    last_message.content if hasattr(last_message, "content") else str(last_message)
-                )
+                content = message_text(result["messages"][-1])
                 typer.echo(f"\n{agent_name}: {content}")
 
     asyncio.run(interactive_loop())
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=128)
 def parse_model_string(model_string: str) -> tuple[str, str]:
     """
     Parse a model string in the format 'provider/model-name'.
 
+    Results are cached: the same few configured model strings are parsed
+    on every settings construction and LLM lookup.
+
     Args:
         model_string: Model identifier string (e.g., 'openai/gpt-4o')
 
@@ -167,16 +173,84 @@ class Settings(BaseSettings):
 
     telegram_bot_token: str | None = Field(default=None, description="Telegram bot token")
     telegram_enabled: bool = Field(default=False, description="Enable Telegram bot")
+    telegram_mode: Literal["polling", "webhook"] = Field(
+        default="polling",
+        description="Receive updates by long polling or by a webhook Telegram pushes to",
+    )
+    telegram_webhook_url: str | None = Field(
+        default=None, description="Public base URL Telegram posts webhook updates to"
+    )
+    telegram_webhook_listen: str = Field(
+        default="0.0.0.0", description="Address the webhook server binds to"
+    )
+    telegram_webhook_port: int = Field(default=8443, description="Port the webhook server binds to")
+    telegram_webhook_secret: str | None = Field(
+        default=None, description="Secret Telegram sends with each webhook request"
+    )
+    telegram_response_cache_ttl: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Seconds to reuse the reply to a message repeated at the same point in a "
+            "conversation (0 disables). Cache hits skip the agent, so the repeated turn "
+            "is not recorded in the thread"
+        ),
+    )
+    telegram_semantic_cache_model: str | None = Field(
+        default=None,
+        description="Embedding model (provider/model) for matching paraphrased repeats",
+    )
+    telegram_semantic_cache_threshold: float = Field(
+        default=0.92,
+        ge=0,
+        le=1,
+        description="Minimum cosine similarity to reuse a reply to a paraphrased message",
+    )
+    telegram_checkpoint_durability: Literal["sync", "async", "exit"] = Field(
+        default="async",
+        description=(
+            "When Telegram turns are checkpointed: 'sync'/'async' persist every step, 'exit' "
+            "writes once at the end and loses the whole turn on a crash or cancellation"
+        ),
+    )
 
     tavily_api_key: str | None = Field(default=None, description="Tavily API key for web search")
+    tavily_base_url: str = Field(
+        default="https://api.tavily.com", description="Tavily API base URL"
+    )
 
     firecrawl_api_key: str | None = Field(default=None, description="Firecrawl API key")
+    firecrawl_base_url: str = Field(
+        default="https://api.firecrawl.dev/v1", description="Firecrawl API base URL"
+    )
+
+    http_timeouts: dict[str, float] = Field(
+        default_factory=lambda: {"search": 60.0, "scrape": 60.0, "crawl": 120.0, "map": 60.0},
+        description="Web tool HTTP timeouts in seconds, keyed by operation",
+    )
+    web_tool_max_concurrency: int = Field(
+        default=20, ge=1, description="Maximum concurrent calls per web tool API"
+    )
+    web_crawl_summarize: bool = Field(
+        default=False,
+        description="Summarize each crawled page with the summarization model",
+    )
 
     agent_name: str = Field(
         default="Executive Assistant",
         description="Name of the agent (customizable by user)",
     )
 
+    @model_validator(mode="after")
+    def validate_telegram_webhook(self) -> Settings:
+        if (
+            self.telegram_enabled
+            and self.telegram_mode == "webhook"
+            and not self.telegram_webhook_url
+        ):
+            raise ValueError("TELEGRAM_WEBHOOK_URL is required when TELEGRAM_MODE=webhook")
+        return self
+
     @property
     def is_langfuse_configured(self) -> bool:
         return bool(self.langfuse_enabled and self.langfuse_public_key and self.langfuse_secret_key)
@@ -0,0 +1,13 @@
+from src.http.clients import (
+    close_oauth_client,
+    close_web_client,
+    get_oauth_client,
+    get_web_client,
+)
+
+__all__ = [
+    "close_oauth_client",
+    "close_web_client",
+    "get_oauth_client",
+    "get_web_client",
+]
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+import httpx
+
+from src.config.settings import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+OVERLOAD_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class AIMDLimiter:
+    """
+    Adaptive concurrency limiter for calls to a single upstream API.
+
+    Uses additive-increase/multiplicative-decrease: each healthy call grows
+    the limit by roughly one slot per window of `limit` calls, while an
+    overload signal (429/5xx or a transport error) halves it. A Retry-After
+    header pauses new calls until the upstream is ready again.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 20,
+        min_concurrency: int = 1,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease_factor = decrease_factor
+        self.limit: float = float(max_concurrency)
+
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._condition = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for any pending Retry-After pause, then for a free slot.
+
+        The pause is waited out before the slot is taken, so cancelling a
+        caller mid-pause never leaves a slot held.
+        """
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            async with self._condition:
+                await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+                # A call released while we waited may have extended the pause
+                if self._resume_at <= time.monotonic():
+                    self._in_flight += 1
+                    return
+
+    async def release(self, overloaded: bool | None, retry_after: float | None = None) -> None:
+        """Free a slot and adjust the limit.
+
+        Args:
+            overloaded: True for an overload signal, False for a healthy call,
+                None when the outcome says nothing about upstream capacity.
+            retry_after: Seconds the upstream asked us to wait, if any.
+        """
+        async with self._condition:
+            self._in_flight -= 1
+
+            if overloaded:
+                self.limit = max(float(self.min_concurrency), self.limit * self.decrease_factor)
+            elif overloaded is False:
+                self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+
+            if retry_after:
+                self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+
+            self._condition.notify_all()
+
+
+_limiters: dict[str, AIMDLimiter] = {}
+
+
+def get_limiter(name: str) -> AIMDLimiter:
+    """Get the limiter for an upstream API, creating it on first use."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        settings = get_settings()
+        limiter = AIMDLimiter(max_concurrency=settings.web_tool_max_concurrency)
+        _limiters[name] = limiter
+    return limiter
+
+
+def reset_limiters() -> None:
+    """Drop all limiters (useful for testing)."""
+    _limiters.clear()
+
+
+def _parse_retry_after(response: httpx.Response) -> float | None:
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _classify_response(response: httpx.Response) -> tuple[bool, float | None]:
+    if response.status_code in OVERLOAD_STATUS_CODES:
+        return True, _parse_retry_after(response)
+    return False, None
+
+
+def backpressured(
+    name: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """
+    Run an async upstream call under the named AIMD limiter.
+
+    The wrapped coroutine should return an httpx.Response or raise
+    httpx errors (e.g. via raise_for_status) so the limiter can tell
+    healthy calls from overload.
+
+    Args:
+        name: Upstream identifier (e.g., 'firecrawl', 'tavily')
+    """
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            limiter = get_limiter(name)
+            acquired = False
+            overloaded: bool | None = None
+            retry_after: float | None = None
+            try:
+                await limiter.acquire()
+                acquired = True
+                result = await func(*args, **kwargs)
+                if isinstance(result, httpx.Response):
+                    overloaded, retry_after = _classify_response(result)
+                else:
+                    overloaded = False
+                return result
+            except httpx.HTTPStatusError as e:
+                overloaded, retry_after = _classify_response(e.response)
+                raise
+            except httpx.TransportError:
+                overloaded = True
+                raise
+            finally:
+                if acquired:
+                    await limiter.release(overloaded, retry_after)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import httpx
+
+_web_client: httpx.AsyncClient | None = None
+_oauth_client: httpx.AsyncClient | None = None
+
+
+def get_web_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used by the web tools.
+
+    The client keeps connections alive between calls, so repeated requests
+    to the same host reuse the pooled TCP/TLS session instead of paying a
+    fresh handshake per tool invocation.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _web_client
+
+    if _web_client is None or _web_client.is_closed:
+        _web_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+        )
+
+    return _web_client
+
+
+async def close_web_client() -> None:
+    """Close the shared web tools client and release pooled connections."""
+    global _web_client
+
+    if _web_client is not None:
+        await _web_client.aclose()
+        _web_client = None
+
+
+def get_oauth_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used for OAuth token exchanges.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _oauth_client
+
+    if _oauth_client is None or _oauth_client.is_closed:
+        _oauth_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=10),
+            http2=True,
+        )
+
+    return _oauth_client
+
+
+async def close_oauth_client() -> None:
+    """Close the shared OAuth client and release pooled connections."""
+    global _oauth_client
+
+    if _oauth_client is not None:
+        await _oauth_client.aclose()
+        _oauth_client = None
@@ -8,7 +8,7 @@ with SQLite + FTS5 + vec is complete.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
@@ -169,8 +169,6 @@ class MemoryDB:
         limit: int = 10,
     ) -> list[dict]:
         """Get recent memories."""
-        from datetime import timedelta
-
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         results = []
 
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Callable
 
 from langchain.agents.middleware import AgentMiddleware
-from langchain.messages import AIMessage
+from langchain.messages import AIMessage, SystemMessage
 
 if TYPE_CHECKING:
     from langchain.agents.middleware import AgentState, ModelRequest, ModelResponse
@@ -134,8 +134,6 @@ If there's something important, briefly mention it at the start of your response
 
     def _append_checkin_context(self, system_message, checkin_prompt: str) -> Any:
         """Append check-in context to system message."""
-        from langchain.messages import SystemMessage
-
         existing_content = system_message.content
 
         if isinstance(existing_content, str):
@@ -162,8 +160,6 @@ If there's something important, briefly mention it at the start of your response
 
         next_checkin = None
         if self._last_checkin:
-            from datetime import timedelta
-
             next_checkin = self._last_checkin + timedelta(minutes=self.interval_minutes)
 
         return {
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
+import orjson
 from langchain.agents.middleware import AgentMiddleware
 
 if TYPE_CHECKING:
@@ -61,8 +61,8 @@ class LoggingMiddleware(AgentMiddleware):
         }
 
         log_file = self._get_log_file()
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        with open(log_file, "ab") as f:
+            f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
 
     def before_model(
         self,
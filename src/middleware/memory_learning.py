@@ -4,6 +4,7 @@ import json
 from typing import TYPE_CHECKING, Any
 
 from langchain.agents.middleware import AgentMiddleware
+from langchain.messages import HumanMessage, SystemMessage
 
 if TYPE_CHECKING:
     from langchain.agents.middleware import AgentState
@@ -77,8 +78,10 @@ class MemoryLearningMiddleware(AgentMiddleware):
         """Format messages into a single string."""
         lines = []
         for msg in messages:
-            role = msg.type if hasattr(msg, "type") else "unknown"
-            content = msg.content if hasattr(msg, "content") else str(msg)
+            role = getattr(msg, "type", "unknown")
+            content = getattr(msg, "content", None)
+            if content is None:
+                content = str(msg)
 
             if role == "human":
                 lines.append(f"User: {content}")
@@ -89,8 +92,6 @@ class MemoryLearningMiddleware(AgentMiddleware):
 
     def _llm_extraction(self, conversation: str) -> list[dict]:
         """Use LLM to extract memories from conversation."""
-        from langchain.messages import HumanMessage, SystemMessage
-
         prompt = f"""Analyze this conversation and extract important information about the user.
 
 For each piece of information, determine:
@@ -130,7 +131,7 @@ Only extract meaningful, non-obvious information. Return empty array if nothing
         memories = []
 
         for msg in messages:
-            content = msg.content if hasattr(msg, "content") else ""
+            content = getattr(msg, "content", "")
             if not isinstance(content, str):
                 continue
 
@@ -6,6 +6,7 @@ from src.observability.langfuse import (
     reset_langfuse_client,
     trace_llm_call,
 )
+from src.observability.logs import start_queue_logging
 
 __all__ = [
     "LangfuseClient",
@@ -13,5 +14,6 @@ __all__ = [
     "get_langfuse_client",
     "is_langfuse_enabled",
     "reset_langfuse_client",
+    "start_queue_logging",
     "trace_llm_call",
 ]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+
+def start_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route root logging through a queue drained on a background thread.
+
+    Log calls on the event loop only enqueue the record; formatting and the
+    write to stderr happen on the listener thread, so a slow log sink never
+    blocks the loop.
+
+    Args:
+        level: Root logger level
+
+    Returns:
+        The started listener; call stop() on shutdown to flush it
+    """
+    queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(QueueHandler(queue))
+    root.setLevel(level)
+
+    listener = QueueListener(queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Any
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.config.settings import get_settings
+
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
@@ -116,8 +118,6 @@ def get_postgres_connection(database_url: str | None = None) -> PostgresConnecti
 
     if _postgres_connection is None:
         if database_url is None:
-            from src.config.settings import get_settings
-
             settings = get_settings()
             database_url = settings.database_url
 
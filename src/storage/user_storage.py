@@ -1,10 +1,33 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 
+def _tree_size(path: Path) -> int:
+    """Total size in bytes of the files under a directory.
+
+    Uses os.scandir so each directory is read once and entry types come
+    from the directory listing rather than a stat per entry.
+    """
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _tree_size(Path(entry.path))
+            elif entry.is_file():
+                total += entry.stat().st_size
+    return total
+
+
+def _subdirectories(path: Path) -> list[os.DirEntry[str]]:
+    """Non-hidden subdirectories of a directory, from a single scandir pass."""
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if entry.is_dir() and not entry.name.startswith(".")]
+
+
 class UserStorage:
     """
     Manages per-user storage with minimal enforcement.
@@ -117,9 +140,7 @@ class UserStorage:
         """List all project directories."""
         if not self.projects_dir.exists():
             return []
-        return [
-            d.name for d in self.projects_dir.iterdir() if d.is_dir() and not d.name.startswith(".")
-        ]
+        return [entry.name for entry in _subdirectories(self.projects_dir)]
 
     def project_exists(self, project_name: str) -> bool:
         """Check if a project exists."""
@@ -153,24 +174,16 @@ class UserStorage:
             return stats
 
         projects = []
-        total_size = 0
-
-        for item in self.user_root.rglob("*"):
-            if item.is_file():
-                total_size += item.stat().st_size
+        total_size = _tree_size(self.user_root)
 
         if self.projects_dir.exists():
-            for project_dir in self.projects_dir.iterdir():
-                if project_dir.is_dir() and not project_dir.name.startswith("."):
-                    project_size = sum(
-                        f.stat().st_size for f in project_dir.rglob("*") if f.is_file()
-                    )
-                    projects.append(
-                        {
-                            "name": project_dir.name,
-                            "size_bytes": project_size,
-                        }
-                    )
+            for project_dir in _subdirectories(self.projects_dir):
+                projects.append(
+                    {
+                        "name": project_dir.name,
+                        "size_bytes": _tree_size(Path(project_dir.path)),
+                    }
+                )
 
         stats["projects"] = projects
         stats["total_size_bytes"] = total_size
@@ -1,20 +1,260 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
+import re
+import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+import numpy as np
+from langchain_core.messages import HumanMessage
+from telegram.error import NetworkError, RetryAfter, TimedOut
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 
+from src.agent import AgentCache, message_text, open_checkpointer
 from src.config.settings import get_settings, parse_model_string
 from src.llm import get_llm
 from src.llm.errors import LLMError
+from src.observability.logs import start_queue_logging
+from telegram import Update
 
 if TYPE_CHECKING:
-    from telegram import Update
+    from langchain_core.embeddings import Embeddings
+    from langgraph.types import Durability
 
 logger = logging.getLogger(__name__)
 
+# Telegram rejects messages over 4096 UTF-16 code units. Characters outside
+# the BMP (most emoji) count twice, so chunks are measured in code units.
+MAX_MESSAGE_LENGTH = 4096
+
+# Messages whose answer depends on when they are asked are never served from cache.
+UNCACHEABLE_PATTERN = re.compile(
+    r"\b(time|now|today|tonight|tomorrow|yesterday|weather|latest|news)\b", re.IGNORECASE
+)
+
+# Outbound replies go through a per-chat queue drained by that chat's own
+# sender task, so replies stay in order and a chat under flood control never
+# delays anyone else. SEND_CONCURRENCY caps in-flight sendMessage calls below
+# the connection pool size; rate-limit backoff happens outside that cap.
+SEND_CONCURRENCY = 16
+SEND_MAX_ATTEMPTS = 5
+SEND_BACKOFF_SECONDS = 1.0
+
+# Bot API calls share one HTTP/2 connection pool sized for the concurrent
+# sends plus handlers replying directly.
+CONNECTION_POOL_SIZE = 32
+POOL_TIMEOUT_SECONDS = 5.0
+CONNECT_TIMEOUT_SECONDS = 5.0
+READ_TIMEOUT_SECONDS = 30.0
+
+# How long each getUpdates long poll is held open when idle; Telegram answers
+# as soon as an update arrives, so this only cuts empty round trips.
+POLL_TIMEOUT_SECONDS = 50
+
+
+def _utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units, as Telegram counts it."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _split_message(text: str, limit: int = MAX_MESSAGE_LENGTH) -> list[str]:
+    """Pack text into as few Telegram-sized chunks as possible.
+
+    Lines are read one at a time and packed greedily so chunks break on
+    line boundaries; a single line longer than the limit is hard-split
+    without breaking surrogate pairs.
+
+    Args:
+        text: Message text
+        limit: Maximum UTF-16 code units per chunk
+
+    Returns:
+        List of chunks, in order
+    """
+    if _utf16_len(text) <= limit:
+        return [text]
+
+    chunks: list[str] = []
+    parts: list[str] = []
+    size = 0
+    for line in io.StringIO(text):
+        length = _utf16_len(line)
+        if length > limit:
+            if parts:
+                chunks.append("".join(parts))
+                parts.clear()
+                size = 0
+            start = 0
+            length = 0
+            for i, char in enumerate(line):
+                width = 2 if ord(char) > 0xFFFF else 1
+                if length + width > limit:
+                    chunks.append(line[start:i])
+                    start = i
+                    length = 0
+                length += width
+            line = line[start:]
+
+        if size + length > limit:
+            chunks.append("".join(parts))
+            parts.clear()
+            size = 0
+        parts.append(line)
+        size += length
+
+    if parts:
+        chunks.append("".join(parts))
+    return chunks
+
+
+CacheKey = tuple[int, str | None, str]
+
+
+class ResponseCache:
+    """
+    Per-user LRU cache of replies to repeated messages, with a TTL.
+
+    Keys are (user_id, conversation head, normalized text): replies never
+    leak across users, and a reply is only reused while the conversation is
+    where it was when the reply was given, so short follow-ups like "yes"
+    are never answered from an earlier turn.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, tuple[float, str]] = OrderedDict()
+        self._heads: OrderedDict[int, str] = OrderedDict()
+
+    def key(self, user_id: int, text: str) -> CacheKey | None:
+        """Build the cache key for a message, or None if it must not be cached."""
+        if self.ttl <= 0 or UNCACHEABLE_PATTERN.search(text):
+            return None
+        return user_id, self._heads.get(user_id), " ".join(text.lower().split())
+
+    def advance(self, user_id: int, head: str) -> None:
+        """Record that the user's conversation moved on to a new turn."""
+        if self.ttl <= 0:
+            return
+        self._heads[user_id] = head
+        self._heads.move_to_end(user_id)
+        if len(self._heads) > self.maxsize:
+            self._heads.popitem(last=False)
+
+    def get(self, key: CacheKey) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: CacheKey, reply: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, reply)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear_user(self, user_id: int) -> None:
+        """Forget every cached reply for a user."""
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+        self._heads.pop(user_id, None)
+
+
+class SemanticResponseCache:
+    """
+    Per-user reply cache keyed by message embeddings, for paraphrased repeats.
+
+    Sits behind ResponseCache: only messages that miss the exact cache are
+    embedded. Vectors are kept normalized in a fixed-size ring buffer, so a
+    lookup is one matrix-vector product over the most recent entries.
+    Embeddings are also memoized by normalized text across users, so a
+    message seen before is never sent to the embedding model twice.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        ttl: float,
+        threshold: float = 0.92,
+        maxsize: int = 512,
+        embedding_cache_size: int = 1024,
+    ) -> None:
+        self.embeddings = embeddings
+        self.embedding_cache_size = embedding_cache_size
+        self._embedded: OrderedDict[str, np.ndarray] = OrderedDict()
+        self.ttl = ttl
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._vectors: np.ndarray | None = None
+        self._users = np.zeros(maxsize, dtype=np.int64)
+        self._heads = np.zeros(maxsize, dtype=np.int64)
+        self._expires = np.zeros(maxsize, dtype=np.float64)
+        self._replies: list[str] = [""] * maxsize
+        self._next = 0
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a message as a unit vector."""
+        key = " ".join(text.lower().split())
+        vector = self._embedded.get(key)
+        if vector is not None:
+            self._embedded.move_to_end(key)
+            return vector
+
+        vector = np.asarray(await self.embeddings.aembed_query(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        vector.flags.writeable = False
+
+        self._embedded[key] = vector
+        if len(self._embedded) > self.embedding_cache_size:
+            self._embedded.popitem(last=False)
+        return vector
+
+    def get(self, user_id: int, head: str | None, vector: np.ndarray) -> str | None:
+        """Return the reply to this user's most similar live message, if close enough.
+
+        Only entries stored at the same conversation head (see ResponseCache)
+        are considered.
+        """
+        if self._vectors is None:
+            return None
+        scores = self._vectors @ vector
+        live = (
+            (self._users == user_id)
+            & (self._heads == hash(head))
+            & (self._expires > time.monotonic())
+        )
+        scores[~live] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._replies[best]
+
+    def set(self, user_id: int, head: str | None, vector: np.ndarray, reply: str) -> None:
+        if self._vectors is None:
+            self._vectors = np.zeros((self.maxsize, vector.shape[0]), dtype=np.float32)
+        slot = self._next
+        self._vectors[slot] = vector
+        self._users[slot] = user_id
+        self._heads[slot] = hash(head)
+        self._expires[slot] = time.monotonic() + self.ttl
+        self._replies[slot] = reply
+        self._next = (slot + 1) % self.maxsize
+
+    def clear_user(self, user_id: int) -> None:
+        """Forget every cached reply for a user."""
+        self._expires[self._users == user_id] = 0.0
+
 
 class TelegramBot:
     """
@@ -33,17 +273,48 @@ class TelegramBot:
         token: str,
         default_provider: str = "openai",
         default_model: str = "gpt-4o",
+        response_cache_ttl: float = 0.0,
+        checkpoint_durability: Durability = "async",
+        semantic_cache: SemanticResponseCache | None = None,
+        webhook_url: str | None = None,
+        webhook_listen: str = "0.0.0.0",
+        webhook_port: int = 8443,
+        webhook_secret: str | None = None,
     ) -> None:
         self.token = token
         self.default_provider = default_provider
         self.default_model = default_model
         self._application: Application | None = None
         self._user_models: dict[int, tuple[str, str]] = {}
+        self._exit_stack: AsyncExitStack | None = None
+        self._agent_cache: AgentCache | None = None
+        self._response_cache = ResponseCache(ttl=response_cache_ttl)
+        self._semantic_cache = semantic_cache
+        self.webhook_url = webhook_url
+        self.webhook_listen = webhook_listen
+        self.webhook_port = webhook_port
+        self.webhook_secret = webhook_secret
+        self.checkpoint_durability = checkpoint_durability
+        self._sending = False
+        self._send_slots = asyncio.Semaphore(SEND_CONCURRENCY)
+        self._out_queues: dict[int, asyncio.Queue[list[str]]] = {}
+        self._senders: dict[int, asyncio.Task[None]] = {}
+        self._user_locks: dict[int, asyncio.Lock] = {}
+        self._user_pending: dict[int, int] = {}
 
     @property
     def application(self) -> Application:
         if self._application is None:
-            self._application = Application.builder().token(self.token).build()
+            self._application = (
+                Application.builder()
+                .token(self.token)
+                .http_version("2")
+                .connection_pool_size(CONNECTION_POOL_SIZE)
+                .pool_timeout(POOL_TIMEOUT_SECONDS)
+                .connect_timeout(CONNECT_TIMEOUT_SECONDS)
+                .read_timeout(READ_TIMEOUT_SECONDS)
+                .build()
+            )
             self._setup_handlers()
         return self._application
 
@@ -149,17 +420,51 @@ class TelegramBot:
             return
 
         context.user_data["messages"] = []
+        if update.effective_user:
+            self._response_cache.clear_user(update.effective_user.id)
+            if self._semantic_cache is not None:
+                self._semantic_cache.clear_user(update.effective_user.id)
         await update.effective_message.reply_text("Conversation history cleared.")
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle incoming text messages."""
+        """Handle incoming text messages.
+
+        The agent run is handed to a task tracked by the application, so the
+        dispatcher moves on to other chats while a long agent turn runs.
+        """
         if not update.effective_message or not update.effective_user:
             return
 
         user_id = update.effective_user.id
         user_message = update.effective_message.text
 
-        await self._handle_deep_agent(update, context, user_id, user_message)
+        context.application.create_task(
+            self._handle_user_message(update, context, user_id, user_message), update=update
+        )
+
+    async def _handle_user_message(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        user_id: int,
+        user_message: str,
+    ) -> None:
+        """Run one user's messages one at a time, in the order they arrived."""
+        lock = self._user_locks.get(user_id)
+        if lock is None:
+            lock = self._user_locks[user_id] = asyncio.Lock()
+        self._user_pending[user_id] = self._user_pending.get(user_id, 0) + 1
+        try:
+            async with lock:
+                await self._handle_deep_agent(update, context, user_id, user_message)
+        finally:
+            # Drop the lock once no turn holds or waits on it, so idle users cost nothing
+            remaining = self._user_pending[user_id] - 1
+            if remaining:
+                self._user_pending[user_id] = remaining
+            else:
+                del self._user_pending[user_id]
+                del self._user_locks[user_id]
 
     async def _handle_deep_agent(
         self,
@@ -169,53 +474,186 @@ class TelegramBot:
         user_message: str,
     ) -> None:
         """Handle message using deep agent."""
-        from langchain_core.messages import HumanMessage
-
-        from src.agent import create_ken_agent
-
         provider, model = self._user_models.get(
             user_id, (self.default_provider, self.default_model)
         )
 
         try:
-            settings = get_settings()
             thread_id = f"telegram-{user_id}"
 
-            async with create_ken_agent(settings, user_id=str(user_id)) as agent:
+            cache_key = self._response_cache.key(user_id, user_message)
+            reply = self._response_cache.get(cache_key) if cache_key else None
+
+            vector = None
+            if reply is None and cache_key and self._semantic_cache is not None:
+                # The semantic tier is an optimization: if embedding fails,
+                # treat it as a miss and let the agent answer.
+                try:
+                    vector = await self._semantic_cache.embed(user_message)
+                    reply = self._semantic_cache.get(user_id, cache_key[1], vector)
+                except Exception:
+                    logger.warning("Semantic cache lookup failed", exc_info=True)
+                    vector = None
+
+            if reply is None:
+                agent = await self._get_agent_cache().get_or_create(str(user_id))
                 result = await agent.ainvoke(
                     {"messages": [HumanMessage(content=user_message)]},
                     config={"configurable": {"thread_id": thread_id}},
+                    durability=self.checkpoint_durability,
                 )
-
-            last_message = result["messages"][-1]
-            content = (
-                last_message.content if hasattr(last_message, "content") else str(last_message)
-            )
-
-            await update.effective_message.reply_text(content)
+                last = result["messages"][-1]
+                reply = message_text(last)
+                if cache_key:
+                    self._response_cache.advance(user_id, f"{len(result['messages'])}:{last.id}")
+                    cache_key = self._response_cache.key(user_id, user_message)
+                    # Cacheability depends only on the message, which hasn't changed
+                    assert cache_key is not None
+                    self._response_cache.set(cache_key, reply)
+                    if vector is not None and self._semantic_cache is not None:
+                        self._semantic_cache.set(user_id, cache_key[1], vector, reply)
+
+            await self.send_message(update.effective_message.chat_id, reply)
 
         except LLMError as e:
             logger.error(f"LLM error: {e}")
-            await update.effective_message.reply_text(f"Sorry, I encountered an error: {e.message}")
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            await update.effective_message.reply_text(
-                "Sorry, an unexpected error occurred. Please try again."
+            await self.send_message(
+                update.effective_message.chat_id, f"Sorry, I encountered an error: {e.message}"
+            )
+        except Exception:
+            logger.exception("Telegram handler failed")
+            await self.send_message(
+                update.effective_message.chat_id,
+                "Sorry, an unexpected error occurred. Please try again.",
             )
 
+    async def send_message(self, chat_id: int, text: str) -> None:
+        """Queue a reply for delivery by the chat's sender task.
+
+        The reply is split into Telegram-sized chunks up front and queued as
+        one item, so a chat's replies and their chunks are always delivered
+        in order. The sender task is started on demand and exits once the
+        queue is drained. Before start() the reply is sent inline.
+
+        Args:
+            chat_id: Chat to send to
+            text: Reply text
+        """
+        chunks = _split_message(text)
+        if not self._sending:
+            await self._deliver(chat_id, chunks)
+            return
+
+        queue = self._out_queues.get(chat_id)
+        if queue is None:
+            queue = self._out_queues[chat_id] = asyncio.Queue()
+            self._senders[chat_id] = asyncio.create_task(self._send_worker(chat_id, queue))
+        # Unbounded: turns are serialized per user, so a chat only ever has a
+        # few replies pending.
+        queue.put_nowait(chunks)
+
+    async def _send_worker(self, chat_id: int, queue: asyncio.Queue[list[str]]) -> None:
+        """Drain one chat's outbound queue, then retire."""
+        while not queue.empty():
+            chunks = queue.get_nowait()
+            try:
+                await self._deliver(chat_id, chunks)
+            except Exception:
+                logger.exception(f"Failed to send message to chat {chat_id}")
+            finally:
+                queue.task_done()
+        # No await between the empty check and here, so no reply can be
+        # queued onto a retired sender.
+        del self._out_queues[chat_id]
+        del self._senders[chat_id]
+
+    async def _deliver(self, chat_id: int, chunks: list[str]) -> None:
+        """Send chunks in order, retrying on rate limits and network errors.
+
+        Timeouts are not retried: the message may already have been
+        delivered, and resending it would duplicate it.
+        """
+        for chunk in chunks:
+            for attempt in range(SEND_MAX_ATTEMPTS):
+                try:
+                    async with self._send_slots:
+                        await self.application.bot.send_message(chat_id=chat_id, text=chunk)
+                    break
+                except RetryAfter as e:
+                    if attempt == SEND_MAX_ATTEMPTS - 1:
+                        raise
+                    delay = e.retry_after
+                    if isinstance(delay, timedelta):
+                        delay = delay.total_seconds()
+                    await asyncio.sleep(delay)
+                except TimedOut:
+                    raise
+                except NetworkError:
+                    if attempt == SEND_MAX_ATTEMPTS - 1:
+                        raise
+                    await asyncio.sleep(SEND_BACKOFF_SECONDS * 2**attempt)
+
+    def _get_agent_cache(self) -> AgentCache:
+        """Get the agent cache opened in start()."""
+        if self._agent_cache is None:
+            raise RuntimeError("Telegram bot is not started. Call start() first.")
+        return self._agent_cache
+
     async def start(self) -> None:
-        """Start the bot."""
+        """Start the bot.
+
+        Opens a single checkpointer shared by every chat for the lifetime
+        of the bot, instead of connecting to Postgres per message. Updates
+        are pushed to a webhook when webhook_url is set, otherwise polled.
+        """
+        settings = get_settings()
+        self._exit_stack = AsyncExitStack()
+        checkpointer = await self._exit_stack.enter_async_context(
+            open_checkpointer(settings.database_url)
+        )
+        self._agent_cache = AgentCache(checkpointer, settings)
+
+        self._sending = True
+
         await self.application.initialize()
         await self.application.start()
-        await self.application.updater.start_polling()
+        # Only text messages (commands included) are handled, so skip every
+        # other update type and any backlog queued while the bot was offline.
+        if self.webhook_url:
+            await self.application.updater.start_webhook(
+                listen=self.webhook_listen,
+                port=self.webhook_port,
+                url_path=self.token,
+                webhook_url=f"{self.webhook_url.rstrip('/')}/{self.token}",
+                secret_token=self.webhook_secret,
+                drop_pending_updates=True,
+                allowed_updates=[Update.MESSAGE],
+            )
+        else:
+            await self.application.updater.start_polling(
+                timeout=POLL_TIMEOUT_SECONDS,
+                bootstrap_retries=-1,
+                drop_pending_updates=True,
+                allowed_updates=[Update.MESSAGE],
+            )
 
     async def stop(self) -> None:
         """Stop the bot."""
         if self.application.updater:
             await self.application.updater.stop()
         await self.application.stop()
+
+        # Let queued replies drain; senders retire on their own once empty.
+        self._sending = False
+        await asyncio.gather(*self._senders.values(), return_exceptions=True)
+
         await self.application.shutdown()
 
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._agent_cache = None
+
     async def run(self) -> None:
         """Run the bot (blocking)."""
         await self.start()
@@ -248,10 +686,28 @@ def create_bot() -> TelegramBot | None:
 
     provider, model = parse_model_string(settings.llm.default_model)
 
+    semantic_cache = None
+    if settings.telegram_semantic_cache_model and settings.telegram_response_cache_ttl > 0:
+        from langchain.embeddings import init_embeddings
+
+        embed_provider, embed_model = parse_model_string(settings.telegram_semantic_cache_model)
+        semantic_cache = SemanticResponseCache(
+            init_embeddings(embed_model, provider=embed_provider),
+            ttl=settings.telegram_response_cache_ttl,
+            threshold=settings.telegram_semantic_cache_threshold,
+        )
+
     _bot = TelegramBot(
         token=settings.telegram_bot_token or "",
         default_provider=provider,
         default_model=model,
+        response_cache_ttl=settings.telegram_response_cache_ttl,
+        checkpoint_durability=settings.telegram_checkpoint_durability,
+        semantic_cache=semantic_cache,
+        webhook_url=settings.telegram_webhook_url if settings.telegram_mode == "webhook" else None,
+        webhook_listen=settings.telegram_webhook_listen,
+        webhook_port=settings.telegram_webhook_port,
+        webhook_secret=settings.telegram_webhook_secret,
     )
 
     return _bot
@@ -271,5 +727,8 @@ def run_bot_sync() -> None:
 
 
 if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO)
-    run_bot_sync()
+    listener = start_queue_logging()
+    try:
+        run_bot_sync()
+    finally:
+        listener.stop()
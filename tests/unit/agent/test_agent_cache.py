@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+from src.agent.cache import AgentCache
+from src.agent.factory import _skill_paths_cache
+from src.config.settings import Settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _settings(data_path: Path) -> Settings:
+    return Settings(data_path=data_path)
+
+
+def _new_agent(*args: object, **kwargs: object) -> object:
+    return object()
+
+
+class TestAgentCache:
+    async def test_reuses_agent_for_same_user(self, temp_data_path: Path) -> None:
+        cache = AgentCache(MagicMock(), _settings(temp_data_path))
+
+        with patch("src.agent.cache.build_ken_agent", side_effect=_new_agent) as build:
+            first = await cache.get_or_create("user-1")
+            second = await cache.get_or_create("user-1")
+
+        assert first is second
+        assert build.call_count == 1
+
+    async def test_builds_separate_agents_per_user(self, temp_data_path: Path) -> None:
+        cache = AgentCache(MagicMock(), _settings(temp_data_path))
+
+        with patch("src.agent.cache.build_ken_agent", side_effect=_new_agent):
+            first = await cache.get_or_create("user-1")
+            second = await cache.get_or_create("user-2")
+
+        assert first is not second
+        assert len(cache) == 2
+
+    async def test_evicts_least_recently_used(self, temp_data_path: Path) -> None:
+        cache = AgentCache(MagicMock(), _settings(temp_data_path), maxsize=2)
+
+        with patch("src.agent.cache.build_ken_agent", side_effect=_new_agent) as build:
+            await cache.get_or_create("user-1")
+            await cache.get_or_create("user-2")
+            await cache.get_or_create("user-1")
+            await cache.get_or_create("user-3")
+            await cache.get_or_create("user-1")
+            await cache.get_or_create("user-2")
+
+        assert len(cache) == 2
+        assert build.call_count == 4
+
+    async def test_rebuilds_when_skills_change(self, temp_data_path: Path) -> None:
+        cache = AgentCache(MagicMock(), _settings(temp_data_path))
+
+        with patch("src.agent.cache.build_ken_agent", side_effect=_new_agent):
+            first = await cache.get_or_create("user-1")
+            (temp_data_path / "users" / "user-1" / "skills").mkdir(parents=True)
+            _skill_paths_cache.clear()
+            second = await cache.get_or_create("user-1")
+
+        assert first is not second
+        assert len(cache) == 1
+
+    async def test_concurrent_requests_share_one_build(self, temp_data_path: Path) -> None:
+        cache = AgentCache(MagicMock(), _settings(temp_data_path))
+
+        with patch("src.agent.cache.build_ken_agent", side_effect=_new_agent) as build:
+            agents = await asyncio.gather(*(cache.get_or_create("user-1") for _ in range(5)))
+
+        assert all(agent is agents[0] for agent in agents)
+        assert build.call_count == 1
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from langchain_core.messages import AIMessage
+
+from src.agent.messages import message_text
+
+
+class TestMessageText:
+    def test_string_content(self) -> None:
+        assert message_text(AIMessage(content="hello")) == "hello"
+
+    def test_joins_text_blocks(self) -> None:
+        message = AIMessage(
+            content=[
+                {"type": "text", "text": "Hello, "},
+                {"type": "tool_use", "id": "call-1", "name": "web_search", "input": {}},
+                {"type": "text", "text": "world"},
+            ]
+        )
+        assert message_text(message) == "Hello, world"
+
+    def test_plain_string_blocks(self) -> None:
+        assert message_text(AIMessage(content=["a", "b"])) == "ab"
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from src.agent.prompts import get_system_prompt
+
+
+class TestGetSystemPrompt:
+    def test_includes_agent_name(self) -> None:
+        assert get_system_prompt("Ava").startswith("You are Ava,")
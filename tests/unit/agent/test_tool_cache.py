@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.agent.tool_cache import cached_tool, clear_tool_cache, tool_cache_key
+
+
+class TestToolCacheKey:
+    def test_key_ignores_argument_order(self) -> None:
+        assert tool_cache_key("web_map", {"url": "a", "search": "b"}) == tool_cache_key(
+            "web_map", {"search": "b", "url": "a"}
+        )
+
+    def test_key_differs_by_tool_name(self) -> None:
+        assert tool_cache_key("web_scrape", {"url": "a"}) != tool_cache_key(
+            "web_crawl", {"url": "a"}
+        )
+
+
+class TestCachedTool:
+    def setup_method(self) -> None:
+        clear_tool_cache()
+
+    def teardown_method(self) -> None:
+        clear_tool_cache()
+
+    async def test_returns_cached_result_within_ttl(self) -> None:
+        fetch = AsyncMock(return_value={"data": "page"})
+
+        first = await cached_tool("web_scrape", {"url": "a"}, ttl=60, fn=fetch)
+        second = await cached_tool("web_scrape", {"url": "a"}, ttl=60, fn=fetch)
+
+        assert first == second == {"data": "page"}
+        assert fetch.await_count == 1
+
+    async def test_refetches_after_expiry(self) -> None:
+        fetch = AsyncMock(return_value="result")
+
+        with patch("src.agent.tool_cache.time.monotonic", side_effect=[0.0, 100.0]):
+            await cached_tool("web_search", {"query": "q"}, ttl=60, fn=fetch)
+            await cached_tool("web_search", {"query": "q"}, ttl=60, fn=fetch)
+
+        assert fetch.await_count == 2
+
+    async def test_failures_are_not_cached(self) -> None:
+        fetch = AsyncMock(side_effect=[RuntimeError("boom"), "ok"])
+
+        with pytest.raises(RuntimeError):
+            await cached_tool("web_map", {"url": "a"}, ttl=60, fn=fetch)
+        result = await cached_tool("web_map", {"url": "a"}, ttl=60, fn=fetch)
+
+        assert result == "ok"
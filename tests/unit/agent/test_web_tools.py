@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.agent.factory import (
+    CrawlIncompleteError,
+    _firecrawl_crawl,
+    _format_crawl_pages,
+    _format_search_results,
+)
+
+PAGE = {"markdown": "# Home", "metadata": {"sourceURL": "https://example.com"}}
+
+
+class TestFirecrawlCrawl:
+    async def test_polls_until_completed(self) -> None:
+        post = AsyncMock(return_value={"success": True, "id": "job-1"})
+        get = AsyncMock(
+            side_effect=[
+                {"status": "scraping", "data": []},
+                {"status": "completed", "data": [PAGE]},
+            ]
+        )
+
+        with (
+            patch("src.agent.factory._firecrawl_post", post),
+            patch("src.agent.factory._firecrawl_get", get),
+            patch("src.agent.factory.CRAWL_POLL_INTERVAL_SECONDS", 0),
+        ):
+            pages = await _firecrawl_crawl({"url": "https://example.com"}, "key", "https://fc")
+
+        assert pages == [PAGE]
+        get.assert_awaited_with("crawl/job-1", "key", "https://fc")
+        assert get.await_count == 2
+
+    async def test_raises_with_partial_pages_at_deadline(self) -> None:
+        post = AsyncMock(return_value={"success": True, "id": "job-2"})
+        get = AsyncMock(return_value={"status": "scraping", "data": [PAGE]})
+
+        with (
+            patch("src.agent.factory._firecrawl_post", post),
+            patch("src.agent.factory._firecrawl_get", get),
+            patch("src.agent.factory.time.monotonic", side_effect=[0.0, 1000.0]),
+            pytest.raises(CrawlIncompleteError) as exc_info,
+        ):
+            await _firecrawl_crawl({"url": "https://example.com"}, "key", "https://fc")
+
+        assert exc_info.value.pages == [PAGE]
+
+    async def test_failed_job_raises(self) -> None:
+        post = AsyncMock(return_value={"success": True, "id": "job-3"})
+        get = AsyncMock(return_value={"status": "failed"})
+
+        with (
+            patch("src.agent.factory._firecrawl_post", post),
+            patch("src.agent.factory._firecrawl_get", get),
+            pytest.raises(RuntimeError, match="failed"),
+        ):
+            await _firecrawl_crawl({"url": "https://example.com"}, "key", "https://fc")
+
+
+class TestResultFormatting:
+    def test_search_results_are_separated(self) -> None:
+        text = _format_search_results([("A", "https://a", "alpha"), ("B", "https://b", "beta")])
+
+        assert text == "**A**\nhttps://a\nalpha\n\n---\n**B**\nhttps://b\nbeta\n"
+
+    async def test_crawl_pages_truncate_markdown(self) -> None:
+        page = {"markdown": "x" * 600, "metadata": {"sourceURL": "https://example.com"}}
+
+        text = await _format_crawl_pages([page], max_pages=10)
+
+        assert text == f"**https://example.com**\n{'x' * 500}...\n"
+
+    async def test_empty_crawl_reports_no_pages(self) -> None:
+        assert await _format_crawl_pages([], max_pages=10) == "No pages crawled."
+
+    async def test_crawl_pages_use_summarizer(self) -> None:
+        summarizer = AsyncMock()
+        summarizer.ainvoke.return_value = AIMessage(content="short summary")
+        pages = [
+            {"markdown": "page one", "url": "https://a"},
+            {"markdown": "page two", "url": "https://b"},
+        ]
+
+        text = await _format_crawl_pages(pages, max_pages=10, summarizer=summarizer)
+
+        assert text == "**https://a**\nshort summary\n\n---\n**https://b**\nshort summary\n"
+        assert summarizer.ainvoke.await_count == 2
+
+    async def test_failed_summary_falls_back_to_truncated_page(self) -> None:
+        summarizer = AsyncMock()
+        summarizer.ainvoke.side_effect = [RuntimeError("rate limited"), AIMessage(content="ok")]
+        pages = [
+            {"markdown": "x" * 600, "url": "https://a"},
+            {"markdown": "page two", "url": "https://b"},
+        ]
+
+        text = await _format_crawl_pages(pages, max_pages=10, summarizer=summarizer)
+
+        assert text == f"**https://a**\n{'x' * 500}...\n\n---\n**https://b**\nok\n"
+
+    async def test_summary_with_content_blocks_uses_text(self) -> None:
+        summarizer = AsyncMock()
+        summarizer.ainvoke.return_value = AIMessage(content=[{"type": "text", "text": "short"}])
+
+        text = await _format_crawl_pages(
+            [{"markdown": "page", "url": "https://a"}], max_pages=10, summarizer=summarizer
+        )
+
+        assert text == "**https://a**\nshort\n"
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from langchain_core.messages import AIMessageChunk, ToolMessage
+
+from src.api.routes.chat import _reply_text
+
+
+class TestReplyText:
+    def test_streams_agent_model_text(self) -> None:
+        chunk = AIMessageChunk(content="Hello")
+        assert _reply_text(chunk, {"langgraph_node": "model"}) == "Hello"
+
+    def test_skips_summarization_calls(self) -> None:
+        chunk = AIMessageChunk(content="Summary of the conversation")
+        metadata = {"langgraph_node": "model", "lc_source": "summarization"}
+        assert _reply_text(chunk, metadata) == ""
+
+    def test_skips_model_calls_inside_tools(self) -> None:
+        chunk = AIMessageChunk(content="Page summary")
+        assert _reply_text(chunk, {"langgraph_node": "tools"}) == ""
+
+    def test_skips_non_ai_messages(self) -> None:
+        message = ToolMessage(content="result", tool_call_id="call-1")
+        assert _reply_text(message, {"langgraph_node": "model"}) == ""
+
+    def test_list_content_yields_only_text(self) -> None:
+        chunk = AIMessageChunk(
+            content=[
+                {"type": "text", "text": "Hi"},
+                {"type": "tool_use", "id": "call-1", "name": "web_search", "input": {}},
+            ]
+        )
+        assert _reply_text(chunk, {"langgraph_node": "model"}) == "Hi"
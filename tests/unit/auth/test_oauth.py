@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlsplit
+
+from src.auth.oauth import GoogleOAuth, MicrosoftOAuth, OAuthConfig
+
+
+def _config() -> OAuthConfig:
+    return OAuthConfig(
+        client_id="client-123",
+        client_secret="secret",
+        redirect_uri="https://example.com/callback",
+        scope=["openid", "email"],
+    )
+
+
+class TestGoogleOAuth:
+    def test_auth_url_contains_client_params(self) -> None:
+        url = GoogleOAuth(_config()).get_auth_url()
+        parts = urlsplit(url)
+        query = parse_qs(parts.query)
+
+        assert f"{parts.scheme}://{parts.netloc}{parts.path}" == GoogleOAuth.AUTH_URL
+        assert query["client_id"] == ["client-123"]
+        assert query["redirect_uri"] == ["https://example.com/callback"]
+        assert query["response_type"] == ["code"]
+        assert query["scope"] == ["openid email"]
+        assert "state" not in query
+
+    def test_auth_url_encodes_state(self) -> None:
+        url = GoogleOAuth(_config()).get_auth_url(state="a b&c")
+        query = parse_qs(urlsplit(url).query)
+
+        assert query["state"] == ["a b&c"]
+
+
+class TestMicrosoftOAuth:
+    def test_auth_url_uses_tenant(self) -> None:
+        url = MicrosoftOAuth(_config(), tenant_id="contoso").get_auth_url(state="xyz")
+
+        assert url.startswith("https://login.microsoftonline.com/contoso/oauth2/v2.0/authorize?")
+        assert parse_qs(urlsplit(url).query)["state"] == ["xyz"]
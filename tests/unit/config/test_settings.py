@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from src.config.settings import (
     AppSettings,
@@ -119,6 +120,14 @@ class TestSettings:
         settings = Settings()
         assert settings.data_path == Path("/data")
 
+    def test_telegram_webhook_requires_url(
+        self, mock_env_with_openai: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TELEGRAM_ENABLED", "true")
+        monkeypatch.setenv("TELEGRAM_MODE", "webhook")
+        with pytest.raises(ValidationError, match="TELEGRAM_WEBHOOK_URL"):
+            Settings()
+
 
 class TestGetSettings:
     def test_get_settings_returns_singleton(self, mock_env_with_openai: None) -> None:
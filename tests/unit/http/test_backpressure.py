@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.http.backpressure import AIMDLimiter, backpressured, get_limiter, reset_limiters
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    request = httpx.Request("POST", "https://api.example.com/search")
+    return httpx.Response(status_code, headers=headers, request=request)
+
+
+class TestAIMDLimiter:
+    async def test_halves_limit_on_overload(self) -> None:
+        limiter = AIMDLimiter(max_concurrency=16)
+        await limiter.acquire()
+        await limiter.release(overloaded=True)
+        assert limiter.limit == 8.0
+        assert limiter.in_flight == 0
+
+    async def test_limit_never_drops_below_minimum(self) -> None:
+        limiter = AIMDLimiter(max_concurrency=2, min_concurrency=1)
+        for _ in range(5):
+            await limiter.acquire()
+            await limiter.release(overloaded=True)
+        assert limiter.limit == 1.0
+
+    async def test_recovers_additively_up_to_maximum(self) -> None:
+        limiter = AIMDLimiter(max_concurrency=4)
+        limiter.limit = 2.0
+        for _ in range(50):
+            await limiter.acquire()
+            await limiter.release(overloaded=False)
+        assert limiter.limit == 4.0
+
+    async def test_neutral_outcome_keeps_limit(self) -> None:
+        limiter = AIMDLimiter(max_concurrency=4)
+        limiter.limit = 3.0
+        await limiter.acquire()
+        await limiter.release(overloaded=None)
+        assert limiter.limit == 3.0
+
+    async def test_cancelled_during_pause_holds_no_slot(self) -> None:
+        limiter = AIMDLimiter(max_concurrency=1)
+        await limiter.acquire()
+        await limiter.release(overloaded=True, retry_after=0.05)
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        assert limiter.in_flight == 1
+
+
+class TestBackpressured:
+    def setup_method(self) -> None:
+        reset_limiters()
+
+    def teardown_method(self) -> None:
+        reset_limiters()
+
+    async def test_rate_limited_call_shrinks_limit(self) -> None:
+        @backpressured("test-api")
+        async def call() -> httpx.Response:
+            response = _response(429)
+            response.raise_for_status()
+            return response
+
+        limiter = get_limiter("test-api")
+        start = limiter.limit
+        with pytest.raises(httpx.HTTPStatusError):
+            await call()
+
+        assert limiter.limit == start / 2
+        assert limiter.in_flight == 0
+
+    async def test_transport_error_shrinks_limit(self) -> None:
+        @backpressured("test-api")
+        async def call() -> None:
+            raise httpx.ConnectError("boom")
+
+        limiter = get_limiter("test-api")
+        start = limiter.limit
+        with pytest.raises(httpx.ConnectError):
+            await call()
+
+        assert limiter.limit == start / 2
+
+    async def test_client_error_is_not_overload(self) -> None:
+        @backpressured("test-api")
+        async def call() -> httpx.Response:
+            response = _response(404)
+            response.raise_for_status()
+            return response
+
+        limiter = get_limiter("test-api")
+        start = limiter.limit
+        with pytest.raises(httpx.HTTPStatusError):
+            await call()
+
+        assert limiter.limit == start
+
+    async def test_cancelled_call_releases_nothing_it_did_not_take(self) -> None:
+        @backpressured("test-api")
+        async def call() -> httpx.Response:
+            return _response(200)
+
+        limiter = get_limiter("test-api")
+        await limiter.acquire()
+        await limiter.release(overloaded=True, retry_after=0.05)
+
+        task = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert limiter.in_flight == 0
+        assert (await call()).status_code == 200
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import logging
+from logging.handlers import QueueHandler
+
+from src.observability.logs import start_queue_logging
+
+
+def test_root_logging_goes_through_queue() -> None:
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        listener = start_queue_logging(logging.WARNING)
+        try:
+            assert len(root.handlers) == 1
+            assert isinstance(root.handlers[0], QueueHandler)
+            assert root.level == logging.WARNING
+        finally:
+            listener.stop()
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
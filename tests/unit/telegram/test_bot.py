@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from telegram.error import RetryAfter, TimedOut
+
+from src.telegram.bot import (
+    ResponseCache,
+    SemanticResponseCache,
+    TelegramBot,
+    _split_message,
+    _utf16_len,
+)
+
+
+class TestSplitMessage:
+    def test_short_message_is_single_chunk(self) -> None:
+        assert _split_message("hello") == ["hello"]
+
+    def test_packs_lines_up_to_limit(self) -> None:
+        text = "aaaa\nbbbb\ncccc\n"
+
+        assert _split_message(text, limit=10) == ["aaaa\nbbbb\n", "cccc\n"]
+
+    def test_hard_splits_long_lines(self) -> None:
+        chunks = _split_message("x" * 25, limit=10)
+
+        assert chunks == ["x" * 10, "x" * 10, "x" * 5]
+
+    def test_chunks_rejoin_to_original(self) -> None:
+        text = "\n".join(f"line {i} " + "y" * (i % 40) for i in range(500))
+
+        chunks = _split_message(text, limit=200)
+
+        assert "".join(chunks) == text
+        assert all(len(chunk) <= 200 for chunk in chunks)
+
+    def test_measures_non_bmp_text_in_utf16_units(self) -> None:
+        text = "\U0001f600" * 3000 + "\nok \U0001f44d\n" * 50
+
+        chunks = _split_message(text)
+
+        assert "".join(chunks) == text
+        assert all(_utf16_len(chunk) <= 4096 for chunk in chunks)
+        assert all(not chunk.endswith("\ud83d") for chunk in chunks)
+
+    def test_hard_split_counts_emoji_twice(self) -> None:
+        assert _split_message("\U0001f600" * 6, limit=5) == ["\U0001f600" * 2] * 3
+
+
+class TestResponseCache:
+    def test_normalizes_case_and_whitespace(self) -> None:
+        cache = ResponseCache(ttl=60)
+        cache.set(cache.key(1, "Thanks  a lot"), "You're welcome!")
+
+        assert cache.get(cache.key(1, "  thanks a LOT ")) == "You're welcome!"
+
+    def test_scoped_per_user(self) -> None:
+        cache = ResponseCache(ttl=60)
+        cache.set(cache.key(1, "hi"), "Hello!")
+
+        assert cache.get(cache.key(2, "hi")) is None
+
+    def test_time_sensitive_messages_are_not_cacheable(self) -> None:
+        cache = ResponseCache(ttl=60)
+
+        assert cache.key(1, "What's the weather?") is None
+        assert cache.key(1, "what time is it") is None
+
+    def test_disabled_with_zero_ttl(self) -> None:
+        assert ResponseCache(ttl=0).key(1, "hi") is None
+
+    def test_expired_entries_are_dropped(self) -> None:
+        cache = ResponseCache(ttl=60)
+        key = cache.key(1, "hi")
+
+        with patch("src.telegram.bot.time.monotonic", side_effect=[0.0, 100.0]):
+            cache.set(key, "Hello!")
+            assert cache.get(key) is None
+
+    def test_scoped_to_conversation_head(self) -> None:
+        cache = ResponseCache(ttl=60)
+        cache.advance(1, "2:a")
+        cache.set(cache.key(1, "yes"), "Done.")
+
+        assert cache.get(cache.key(1, "yes")) == "Done."
+        cache.advance(1, "4:b")
+        assert cache.get(cache.key(1, "yes")) is None
+
+    def test_clear_user(self) -> None:
+        cache = ResponseCache(ttl=60)
+        cache.set(cache.key(1, "hi"), "Hello!")
+        cache.set(cache.key(2, "hi"), "Hey!")
+
+        cache.clear_user(1)
+
+        assert cache.get(cache.key(1, "hi")) is None
+        assert cache.get(cache.key(2, "hi")) == "Hey!"
+
+
+class TestSemanticResponseCache:
+    def _cache(self) -> SemanticResponseCache:
+        return SemanticResponseCache(MagicMock(), ttl=60.0, threshold=0.9, maxsize=2)
+
+    def test_serves_similar_message(self) -> None:
+        cache = self._cache()
+        cache.set(1, "h", np.array([1.0, 0.0], dtype=np.float32), "sunny")
+        assert cache.get(1, "h", np.array([0.99, 0.141], dtype=np.float32)) == "sunny"
+
+    def test_misses_dissimilar_message(self) -> None:
+        cache = self._cache()
+        cache.set(1, "h", np.array([1.0, 0.0], dtype=np.float32), "sunny")
+        assert cache.get(1, "h", np.array([0.0, 1.0], dtype=np.float32)) is None
+
+    def test_scoped_per_user(self) -> None:
+        cache = self._cache()
+        cache.set(1, "h", np.array([1.0, 0.0], dtype=np.float32), "sunny")
+        assert cache.get(2, "h", np.array([1.0, 0.0], dtype=np.float32)) is None
+
+    def test_oldest_entry_is_overwritten(self) -> None:
+        cache = self._cache()
+        cache.set(1, "h", np.array([1.0, 0.0], dtype=np.float32), "first")
+        cache.set(1, "h", np.array([0.0, 1.0], dtype=np.float32), "second")
+        cache.set(1, "h", np.array([0.0, -1.0], dtype=np.float32), "third")
+        assert cache.get(1, "h", np.array([1.0, 0.0], dtype=np.float32)) is None
+
+    def test_clear_user(self) -> None:
+        cache = self._cache()
+        cache.set(1, "h", np.array([1.0, 0.0], dtype=np.float32), "sunny")
+        cache.clear_user(1)
+        assert cache.get(1, "h", np.array([1.0, 0.0], dtype=np.float32)) is None
+
+    def test_scoped_to_conversation_head(self) -> None:
+        cache = self._cache()
+        cache.set(1, "h", np.array([1.0, 0.0], dtype=np.float32), "sunny")
+        assert cache.get(1, "other", np.array([1.0, 0.0], dtype=np.float32)) is None
+
+    async def test_embed_normalizes(self) -> None:
+        embeddings = MagicMock()
+        embeddings.aembed_query = AsyncMock(return_value=[3.0, 4.0])
+        cache = SemanticResponseCache(embeddings, ttl=60.0)
+        vector = await cache.embed("hi")
+        assert np.allclose(vector, [0.6, 0.8])
+
+    async def test_embed_reuses_vectors_for_repeated_text(self) -> None:
+        embeddings = MagicMock()
+        embeddings.aembed_query = AsyncMock(return_value=[3.0, 4.0])
+        cache = SemanticResponseCache(embeddings, ttl=60.0)
+        first = await cache.embed("Hello there")
+        second = await cache.embed("hello  there")
+        assert first is second
+        embeddings.aembed_query.assert_awaited_once()
+
+
+class TestSendMessage:
+    def _bot(self) -> tuple[TelegramBot, AsyncMock]:
+        bot = TelegramBot(token="test")
+        bot._application = MagicMock()
+        send = AsyncMock()
+        bot._application.bot.send_message = send
+        return bot, send
+
+    async def test_sends_inline_before_start(self) -> None:
+        bot, send = self._bot()
+        await bot.send_message(42, "hello")
+        send.assert_awaited_once_with(chat_id=42, text="hello")
+
+    async def test_retries_after_rate_limit(self) -> None:
+        bot, send = self._bot()
+        send.side_effect = [RetryAfter(0), None]
+        await bot.send_message(42, "hello")
+        assert send.await_count == 2
+
+    async def test_does_not_retry_timeouts(self) -> None:
+        bot, send = self._bot()
+        send.side_effect = TimedOut()
+        with pytest.raises(TimedOut):
+            await bot.send_message(42, "hello")
+        send.assert_awaited_once()
+
+    async def test_queued_chunks_are_delivered_in_order(self) -> None:
+        bot, send = self._bot()
+        bot._sending = True
+
+        await bot.send_message(42, "a" * 5000)
+        await bot.send_message(42, "b")
+        await asyncio.gather(*bot._senders.values())
+
+        texts = [call.kwargs["text"] for call in send.await_args_list]
+        assert "".join(texts) == "a" * 5000 + "b"
+        assert bot._out_queues == {}
+        assert bot._senders == {}
+
+    async def test_rate_limited_chat_does_not_block_others(self) -> None:
+        bot, send = self._bot()
+        bot._sending = True
+        delivered = asyncio.Event()
+
+        async def fake_send(chat_id: int, text: str) -> None:
+            if chat_id == 1:
+                await delivered.wait()
+                raise RetryAfter(0)
+            delivered.set()
+
+        send.side_effect = fake_send
+        await bot.send_message(1, "throttled")
+        await bot.send_message(2, "hello")
+
+        await asyncio.wait_for(delivered.wait(), timeout=1)
+        send.side_effect = None
+        await asyncio.gather(*bot._senders.values())
+
+        assert send.await_args_list[-1].kwargs == {"chat_id": 1, "text": "throttled"}
+
+
+class TestUserLocks:
+    async def test_turns_run_in_order_and_release_the_lock(self) -> None:
+        bot = TelegramBot(token="test")
+        order: list[str] = []
+
+        async def handle(update: object, context: object, user_id: int, text: str) -> None:
+            order.append(f"start {text}")
+            await asyncio.sleep(0)
+            order.append(f"end {text}")
+
+        with patch.object(bot, "_handle_deep_agent", side_effect=handle):
+            await asyncio.gather(
+                bot._handle_user_message(MagicMock(), MagicMock(), 1, "a"),
+                bot._handle_user_message(MagicMock(), MagicMock(), 1, "b"),
+            )
+
+        assert order == ["start a", "end a", "start b", "end b"]
+        assert bot._user_locks == {}
+        assert bot._user_pending == {}
+
+    async def test_releases_the_lock_when_a_turn_fails(self) -> None:
+        bot = TelegramBot(token="test")
+
+        with (
+            patch.object(bot, "_handle_deep_agent", side_effect=RuntimeError),
+            pytest.raises(RuntimeError),
+        ):
+            await bot._handle_user_message(MagicMock(), MagicMock(), 1, "a")
+
+        assert bot._user_locks == {}